@@ -1,4 +1,5 @@
 using Microsoft.EntityFrameworkCore;
+using Microsoft.AspNetCore.ResponseCompression;
 using CharacterSheetManager.Data;
 using CharacterSheetManager.Repositories.Interfaces;
 using CharacterSheetManager.Repositories;
@@ -53,6 +54,13 @@ builder.Services.AddScoped<ISpellService, SpellService>();
 builder.Services.AddScoped<IItemTemplateService, ItemTemplateService>();
 builder.Services.AddScoped<ISpellTemplateService, SpellTemplateService>();
 
+// HTTP only (EnableForHttps stays off): compressing secrets over TLS invites BREACH/CRIME
+builder.Services.AddResponseCompression(options =>
+{
+    options.Providers.Add<GzipCompressionProvider>();
+});
+builder.Services.AddRequestDecompression();
+
 builder.Services.AddCors(options =>
 {
     options.AddPolicy("AllowAll", policy =>
@@ -75,6 +83,9 @@ if (app.Environment.IsDevelopment())
     });
 }
 
+app.UseResponseCompression();
+app.UseRequestDecompression();
+
 app.UseMiddleware<ExceptionHandlingMiddleware>();
 
 app.UseHttpsRedirection();
@@ -1,351 +1,3021 @@
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import time
 import random
+import threading
+import argparse
+import bisect
+import csv
+import sys
+import os
+import codecs
+import copy
+import itertools
+import sqlite3
+import math
+import socket
+import contextlib
+import multiprocessing
+import base64
+import gzip
+import mmap
+import struct
+import tempfile
+import tracemalloc
+import zlib
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from urllib3.util import connection as urllib3_connection
+from urllib3.util.connection import allowed_gai_family
 
 BASE_URL = "http://localhost:5126/api"
 HEADERS = {"Content-Type": "application/json"}
 
-def make_request(method, endpoint, data=None, retries=3):
-    """Make HTTP request with error handling and retry logic"""
-    url = f"{BASE_URL}/{endpoint}"
+# Connection pool settings for the shared HTTP client
+POOL_CONNECTIONS = 4     # number of per-host pools to keep
+POOL_MAXSIZE = 32        # keep-alive connections kept per host
+REQUEST_TIMEOUT = 30
+
+# Retry policy: attempts per request, exponential backoff bounds (seconds) and a
+# global budget allowing RETRY_BUDGET_MIN retries plus this fraction of all requests
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 10
+RETRY_AFTER_MAX = 60
+RETRY_BUDGET_RATIO = 0.2
+RETRY_BUDGET_MIN = 10
+
+# GET response cache: cached resources, entry lifetime (seconds), in-memory LRU size
+# and an optional SQLite file for a persistent tier shared between runs
+CACHEABLE_RESOURCES = ("itemtemplates", "spelltemplates")
+CACHE_TTL = 300
+CACHE_MAX_ENTRIES = 256
+CACHE_PATH = None
+
+# Streaming reads: chunk size, and pagination scheme the API exposes
+# (None, "page" for ?page=&pageSize= or "keyset" for ?afterId=&limit=)
+STREAM_CHUNK_SIZE = 64 * 1024
+READ_PAGINATION = None
+READ_PAGE_SIZE = 1000
+
+# Bulk creates: records per POST to "<endpoint>/batch" (1 = one POST per record)
+BATCH_SIZE = 1
+
+# Seeding parallelism: concurrent in-flight requests and optional requests/second cap
+SEED_CONCURRENCY = 8
+SEED_RATE_LIMIT = None
+
+# Checkpoint journal: created records are buffered and appended in batches of this size
+JOURNAL_BATCH_SIZE = 500
+
+# Compression: "off" (identity responses), "responses" (gzip responses, the requests
+# default) or "both" (also gzip request bodies of at least GZIP_MIN_BYTES). Level 1
+# because base64 text gains nearly all it can from Huffman coding alone
+COMPRESSION = "responses"
+GZIP_MIN_BYTES = 1024
+GZIP_LEVEL = 1
+
+# Character portraits: share of characters given one, distinct generated images,
+# and characters created/fetched per variant by the portrait cost report
+PORTRAIT_RATIO = 0.5
+PORTRAIT_VARIANTS = 8
+PORTRAIT_SAMPLES = 10
+
+# Instrumentation: latency histogram buckets grow by HISTOGRAM_RATIO from HISTOGRAM_MIN_MS,
+# so reported percentiles are within 10% of the exact value; rows in the cProfile report
+HISTOGRAM_RATIO = 1.1
+HISTOGRAM_MIN_MS = 0.05
+PROFILE_TOP = 30
+
+
+# ---------------------------------------------------------------------------
+# Instrumentation
+# ---------------------------------------------------------------------------
+
+# Route segments followed by a value, named as in the controllers' route templates
+ROUTE_PARAMETERS = {
+    "by-class": "{className}",
+    "by-level": "{level}",
+    "by-school": "{school}",
+    "by-category": "{category}",
+    "by-character": "{characterId}",
+}
+
+def endpoint_template(endpoint):
+    """Collapse IDs and route values and drop the query, e.g. "characters/42" -> "characters/{id}" """
+    segments = endpoint.split("?", 1)[0].strip("/").split("/")
+    template = []
+    for index, segment in enumerate(segments):
+        if index and segments[index - 1] in ROUTE_PARAMETERS:
+            template.append(ROUTE_PARAMETERS[segments[index - 1]])
+        elif segment.isdigit():
+            template.append("{id}")
+        else:
+            template.append(segment)
+    return "/".join(template)
+
+
+# DNS and TCP connect times of the connection opened by the current thread's request, if any
+_connection_phases = threading.local()
+
+
+def _reset_connection_phases():
+    _connection_phases.dns = _connection_phases.connect = None
+
+
+def _ms(seconds):
+    return round(seconds * 1000, 3) if seconds is not None else None
+
+
+def request_event(method, endpoint, attempt, started, response=None, error=None, sent=None, received=None,
+                  content=None):
+    """Build the instrumentation event for one HTTP request started at perf_counter() `started`.
+
+    ttfb_ms runs from the start of the request to the response headers, so like
+    total_ms it includes dns_ms and connect_ms when a new connection was opened.
+    """
+    elapsed = time.perf_counter() - started
+    dns = getattr(_connection_phases, "dns", None)
+    connect = getattr(_connection_phases, "connect", None)
+    return {
+        "ts": round(time.time() - elapsed, 6),
+        "method": method,
+        "endpoint": endpoint_template(endpoint),
+        "status": response.status_code if response is not None else None,
+        "attempt": attempt,
+        "error": type(error).__name__ if error is not None else None,
+        "new_connection": connect is not None,
+        "dns_ms": _ms(dns),
+        "connect_ms": _ms(connect),
+        "ttfb_ms": _ms(response.elapsed.total_seconds()) if response is not None else None,
+        "total_ms": _ms(elapsed),
+        "bytes_sent": sent,
+        "bytes_received": received,
+        "content_bytes": content,
+    }
+
+
+class JsonlTraceSink:
+    """Writes every request event as one JSON line"""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, "w", encoding="utf-8")
+
+    def record(self, event):
+        line = json.dumps(event, separators=(",", ":")) + "\n"
+        with self._lock:
+            self._file.write(line)
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+def nearest_rank(pct, count):
+    """1-based rank of the `pct` percentile among `count` sorted samples (nearest-rank method)"""
+    return min(max(math.ceil(pct / 100 * count), 1), count)
+
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram: constant memory whatever the number of samples"""
+
+    def __init__(self):
+        self.buckets = {}
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, ms):
+        index = 0 if ms <= HISTOGRAM_MIN_MS else int(math.log(ms / HISTOGRAM_MIN_MS, HISTOGRAM_RATIO)) + 1
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += ms
+        self.max = max(self.max, ms)
+
+    def merge(self, other):
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def percentile(self, pct):
+        """Upper bound of the bucket holding the nearest-rank percentile"""
+        if not self.count:
+            return 0.0
+        rank = nearest_rank(pct, self.count)
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min(HISTOGRAM_MIN_MS * HISTOGRAM_RATIO ** index, self.max)
+        return self.max
+
+
+class HistogramSink:
+    """Aggregates request events per method and endpoint template in memory"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.endpoints = {}
+
+    def record(self, event):
+        label = f"{event['method']} {event['endpoint']}"
+        with self._lock:
+            entry = self.endpoints.get(label)
+            if entry is None:
+                entry = self.endpoints[label] = {
+                    "count": 0, "errors": 0, "statuses": {}, "new_connections": 0,
+                    "bytes_sent": 0, "bytes_received": 0,
+                    "total": LatencyHistogram(), "ttfb": LatencyHistogram(),
+                }
+            status = event["status"]
+            entry["count"] += 1
+            entry["statuses"][status] = entry["statuses"].get(status, 0) + 1
+            if status is None or status >= 400:
+                entry["errors"] += 1
+            entry["new_connections"] += event["new_connection"]
+            entry["bytes_sent"] += event["bytes_sent"] or 0
+            entry["bytes_received"] += event["bytes_received"] or 0
+            entry["total"].add(event["total_ms"])
+            if event["ttfb_ms"] is not None:
+                entry["ttfb"].add(event["ttfb_ms"])
+
+    def merge(self, endpoints):
+        """Add another sink's per-endpoint entries, e.g. from a worker process"""
+        with self._lock:
+            for label, other in endpoints.items():
+                entry = self.endpoints.get(label)
+                if entry is None:
+                    self.endpoints[label] = copy.deepcopy(other)
+                    continue
+                for key in ("count", "errors", "new_connections", "bytes_sent", "bytes_received"):
+                    entry[key] += other[key]
+                for status, count in other["statuses"].items():
+                    entry["statuses"][status] = entry["statuses"].get(status, 0) + count
+                entry["total"].merge(other["total"])
+                entry["ttfb"].merge(other["ttfb"])
+
+    def summary(self):
+        """Per-endpoint counts and latency percentiles in milliseconds"""
+        with self._lock:
+            return {
+                label: {
+                    "count": entry["count"],
+                    "errors": entry["errors"],
+                    "statuses": dict(entry["statuses"]),
+                    "new_connections": entry["new_connections"],
+                    "bytes_sent": entry["bytes_sent"],
+                    "bytes_received": entry["bytes_received"],
+                    "mean": entry["total"].total / entry["total"].count,
+                    "p50": entry["total"].percentile(50),
+                    "p95": entry["total"].percentile(95),
+                    "p99": entry["total"].percentile(99),
+                    "max": entry["total"].max,
+                    "ttfb_p50": entry["ttfb"].percentile(50),
+                }
+                for label, entry in sorted(self.endpoints.items())
+            }
+
+    def close(self):
+        pass
+
+
+class Instrumentation:
+    """Fans per-request events out to pluggable sinks.
+
+    A sink is any object with record(event) and close(). Events are only built
+    when at least one sink is attached. `quiet` suppresses per-record progress lines.
+    """
+
+    def __init__(self, sinks=(), quiet=False):
+        self.sinks = list(sinks)
+        self.quiet = quiet
+
+    @property
+    def enabled(self):
+        return bool(self.sinks)
+
+    def add_sink(self, sink):
+        self.sinks.append(sink)
+        return sink
+
+    def find(self, sink_cls):
+        return next((sink for sink in self.sinks if isinstance(sink, sink_cls)), None)
+
+    def emit(self, event):
+        for sink in self.sinks:
+            sink.record(event)
+
+    def close(self):
+        for sink in self.sinks:
+            sink.close()
+
+
+_instrumentation = Instrumentation()
+
+
+def get_instrumentation():
+    return _instrumentation
+
+
+def configure_instrumentation(trace_path=None, histogram=True, quiet=False):
+    """Replace the shared instrumentation, e.g. to write a JSONL trace"""
+    global _instrumentation
+    _instrumentation.close()
+    sinks = []
+    if histogram:
+        sinks.append(HistogramSink())
+    if trace_path:
+        sinks.append(JsonlTraceSink(trace_path))
+    _instrumentation = Instrumentation(sinks, quiet)
+    return _instrumentation
+
+
+def log_record(message):
+    """Print a per-record progress line unless quiet mode is on"""
+    if not _instrumentation.quiet:
+        print(message)
+
+
+def print_request_summary(instrumentation=None):
+    """Print per-endpoint request latencies collected by the histogram sink"""
+    histogram = (instrumentation or get_instrumentation()).find(HistogramSink)
+    if histogram is None:
+        return
+    print(f"{'Request':<40} {'count':>7} {'err%':>6} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8} {'ttfb50':>8}")
+    for label, stats in histogram.summary().items():
+        print(f"{label:<40} {stats['count']:>7} {stats['errors'] / stats['count'] * 100:>5.1f}% "
+              f"{stats['p50']:>8.1f} {stats['p95']:>8.1f} {stats['p99']:>8.1f} {stats['max']:>8.1f} "
+              f"{stats['ttfb_p50']:>8.1f}")
+    print("(latencies in ms)")
+
+
+@contextlib.contextmanager
+def profiling(profiler=None, output=None):
+    """Profile the enclosed block with "cprofile" or "pyinstrument", writing `output` or printing a report.
+
+    Both profilers sample only the calling thread; with --concurrency above 1 the
+    requests themselves run on worker threads, so profile with --concurrency 1 to see them.
+    """
+    if profiler is None:
+        yield
+        return
     
-    for attempt in range(retries):
+    if profiler == "cprofile":
+        import cProfile
+        import pstats
+        profile = cProfile.Profile()
+        profile.enable()
         try:
-            if method == "POST":
-                response = requests.post(url, headers=HEADERS, json=data, timeout=30)
-            elif method == "GET":
-                response = requests.get(url, headers=HEADERS, timeout=30)
-            elif method == "DELETE":
-                response = requests.delete(url, headers=HEADERS, timeout=30)
+            yield
+        finally:
+            profile.disable()
+            if output:
+                profile.dump_stats(output)
+                print(f"📝 Wrote cProfile stats to {output}")
+            else:
+                pstats.Stats(profile).sort_stats("cumulative").print_stats(PROFILE_TOP)
+        return
+    
+    try:
+        from pyinstrument import Profiler
+    except ImportError:
+        raise SystemExit("❌ pyinstrument is not installed (pip install pyinstrument)")
+    profile = Profiler()
+    profile.start()
+    try:
+        yield
+    finally:
+        profile.stop()
+        if output:
+            with open(output, "w", encoding="utf-8") as f:
+                f.write(profile.output_html() if output.endswith(".html") else profile.output_text())
+            print(f"📝 Wrote pyinstrument report to {output}")
+        else:
+            print(profile.output_text(unicode=True))
+
+
+# ---------------------------------------------------------------------------
+# Request bodies and portraits
+# ---------------------------------------------------------------------------
+
+class Portrait:
+    """An image file sent as a character's ImageBase64.
+
+    The base64 text is produced chunk by chunk from a memory-mapped view of the
+    file while the request is being sent, so it never exists as a whole string.
+    """
+
+    CHUNK = 3 * 16 * 1024   # a multiple of 3 keeps chunk encodings free of padding
+
+    def __init__(self, path):
+        self.path = path
+        self.size = os.path.getsize(path)
+
+    def __len__(self):
+        """Length of the base64 encoding"""
+        return 4 * ((self.size + 2) // 3)
+
+    def __repr__(self):
+        return f"Portrait({self.path!r}, {self.size} bytes)"
+
+    def iter_base64(self):
+        if not self.size:
+            return
+        with open(self.path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            for offset in range(0, self.size, self.CHUNK):
+                yield base64.b64encode(view[offset:offset + self.CHUNK])
+
+
+def contains_portrait(value):
+    if isinstance(value, Portrait):
+        return True
+    if isinstance(value, dict):
+        return any(contains_portrait(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(contains_portrait(v) for v in value)
+    return False
+
+
+def _json_chunks(value):
+    """Serialize `value` as JSON bytes in pieces, streaming Portrait values as base64 strings"""
+    if isinstance(value, Portrait):
+        yield b'"'
+        yield from value.iter_base64()
+        yield b'"'
+    elif isinstance(value, dict):
+        yield b"{"
+        for index, (key, item) in enumerate(value.items()):
+            yield (b"," if index else b"") + json.dumps(key).encode() + b":"
+            yield from _json_chunks(item)
+        yield b"}"
+    elif isinstance(value, (list, tuple)):
+        yield b"["
+        for index, item in enumerate(value):
+            if index:
+                yield b","
+            yield from _json_chunks(item)
+        yield b"]"
+    else:
+        yield json.dumps(value).encode()
+
+
+def _json_length(value):
+    if isinstance(value, Portrait):
+        return len(value) + 2
+    if isinstance(value, dict):
+        return (2 + max(len(value) - 1, 0)
+                + sum(len(json.dumps(key).encode()) + 1 + _json_length(item) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return 2 + max(len(value) - 1, 0) + sum(_json_length(item) for item in value)
+    return len(json.dumps(value).encode())
+
+
+class StreamingJsonBody:
+    """File-like JSON request body with a known length, encoded while it is read"""
+
+    def __init__(self, data):
+        self.length = _json_length(data)
+        self.sent = 0
+        self._chunks = _json_chunks(data)
+        self._buffer = b""
+
+    def __len__(self):
+        return self.length
+
+    def read(self, size=-1):
+        while size < 0 or len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        if size < 0:
+            size = len(self._buffer)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        self.sent += len(data)
+        return data
+
+    def __iter__(self):
+        while True:
+            data = self.read(STREAM_CHUNK_SIZE)
+            if not data:
+                return
+            yield data
+
+
+class GzipStream:
+    """Gzip-compresses a stream of byte chunks; sent with chunked transfer encoding"""
+
+    def __init__(self, chunks):
+        self.sent = 0
+        self._chunks = chunks
+
+    def __iter__(self):
+        compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        for chunk in self._chunks:
+            data = compressor.compress(chunk)
+            if data:
+                self.sent += len(data)
+                yield data
+        data = compressor.flush()
+        self.sent += len(data)
+        yield data
+
+
+def encode_body(data, compress=False):
+    """Return (body, headers) for a JSON payload.
+
+    Payloads carrying Portrait values are streamed; with `compress` the body is
+    gzip-encoded when it carries a portrait or is at least GZIP_MIN_BYTES long.
+    """
+    if data is None:
+        return None, {}
+    if contains_portrait(data):
+        if compress:
+            return GzipStream(StreamingJsonBody(data)), {"Content-Encoding": "gzip"}
+        return StreamingJsonBody(data), {}
+    body = json.dumps(data).encode()
+    if compress and len(body) >= GZIP_MIN_BYTES:
+        return gzip.compress(body, GZIP_LEVEL), {"Content-Encoding": "gzip"}
+    return body, {}
+
+
+def body_size(body):
+    """Bytes of `body` put on the wire (after sending, for streamed bodies)"""
+    if body is None:
+        return 0
+    if isinstance(body, bytes):
+        return len(body)
+    return body.sent
+
+
+def write_bmp(path, size, rng):
+    """Write a 24-bit BMP of about `size` bytes filled with noise, incompressible like a real photo"""
+    width = max(int(math.sqrt(max(size - 54, 3) / 3)), 1)
+    row = (width * 3 + 3) & ~3
+    height = max((size - 54) // row, 1)
+    pixels = row * height
+    header = (b"BM" + struct.pack("<IHHI", 54 + pixels, 0, 0, 54)
+              + struct.pack("<IiiHHIIiiII", 40, width, height, 1, 24, 0, pixels, 2835, 2835, 0, 0))
+    partial = f"{path}.{os.getpid()}.tmp"
+    with open(partial, "wb") as f:
+        f.write(header)
+        for offset in range(0, pixels, STREAM_CHUNK_SIZE):
+            f.write(rng.randbytes(min(STREAM_CHUNK_SIZE, pixels - offset)))
+    os.replace(partial, path)   # concurrent seeders may generate the same file
+
+
+PORTRAIT_EXTENSIONS = (".bmp", ".gif", ".jpeg", ".jpg", ".png", ".webp")
+
+
+def load_portraits(size=0, directory=None, seed=0):
+    """Portraits from the image files in `directory`, or PORTRAIT_VARIANTS generated `size`-byte images.
+
+    Generated images are kept in the temp directory and reused by later runs.
+    """
+    if directory:
+        paths = sorted(os.path.join(directory, name) for name in os.listdir(directory)
+                       if name.lower().endswith(PORTRAIT_EXTENSIONS))
+        if not paths:
+            raise ValueError(f"No image files in {directory}")
+        return [Portrait(path) for path in paths]
+    if not size:
+        return []
+    
+    cache_dir = os.path.join(tempfile.gettempdir(), "character-portraits")
+    os.makedirs(cache_dir, exist_ok=True)
+    portraits = []
+    for variant in range(PORTRAIT_VARIANTS):
+        path = os.path.join(cache_dir, f"portrait-{size}-{seed}-{variant}.bmp")
+        if not os.path.exists(path):
+            write_bmp(path, size, _rng(seed, f"portrait-{variant}"))
+        portraits.append(Portrait(path))
+    return portraits
+
+
+def attach_portraits(characters, portraits, ratio=PORTRAIT_RATIO, seed=0, start=0):
+    """Yield the characters, numbered from `start`, giving a deterministic `ratio` share of them a portrait"""
+    draws = _block_rngs(seed, "portraits", start, sys.maxsize, lambda rng: rng.random())
+    for character, (index, rng) in zip(characters, draws):
+        if portraits and rng.random() < ratio:
+            character = dict(character, imageBase64=portraits[index % len(portraits)])
+        yield character
+
+
+# ---------------------------------------------------------------------------
+# HTTP client
+# ---------------------------------------------------------------------------
+
+class ClientStats:
+    """Thread-safe counters for connection reuse and transferred bytes"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.connections_opened = 0
+        self.connections_reused = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+    def record_connection(self):
+        with self._lock:
+            self.connections_opened += 1
+
+    def record_request(self, sent, received, reused):
+        with self._lock:
+            self.requests += 1
+            self.connections_reused += reused
+            self.bytes_sent += sent
+            self.bytes_received += received
+
+    def merge(self, snapshot):
+        """Add another client's snapshot, e.g. from a worker process"""
+        with self._lock:
+            self.requests += snapshot["requests"]
+            self.connections_opened += snapshot["connections_opened"]
+            self.connections_reused += snapshot["connections_reused"]
+            self.bytes_sent += snapshot["bytes_sent"]
+            self.bytes_received += snapshot["bytes_received"]
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "connections_opened": self.connections_opened,
+                "connections_reused": self.connections_reused,
+                "bytes_sent": self.bytes_sent,
+                "bytes_received": self.bytes_received,
+            }
+
+
+def _opened_connection():
+    """Whether the current thread's last request had to open a socket"""
+    return getattr(_connection_phases, "connect", None) is not None
+
+
+_create_connection = urllib3_connection.create_connection
+
+
+def _timed_create_connection(address, *args, **kwargs):
+    """urllib3's create_connection, split into DNS and connect phases for a TimedConnection.
+
+    The host is resolved once, here, and each address it resolves to is handed in
+    turn to urllib3's own create_connection. Those are IP literals, which getaddrinfo
+    answers without a query, so urllib3 still falls back across addresses but the
+    name is looked up only once. Other connections pass straight through.
+    """
+    if not getattr(_connection_phases, "timing", False):
+        return _create_connection(address, *args, **kwargs)
+    host, port = address
+    started = time.perf_counter()
+    try:
+        addresses = socket.getaddrinfo(host.strip("[]"), port, allowed_gai_family(), socket.SOCK_STREAM)
+    finally:
+        resolved = time.perf_counter()
+        _connection_phases.dns = resolved - started
+    error = OSError("getaddrinfo returns an empty list")
+    try:
+        for *_, sockaddr in addresses:
+            try:
+                return _create_connection((sockaddr[0], port), *args, **kwargs)
+            except OSError as e:
+                error = e
+        raise error
+    finally:
+        _connection_phases.connect = time.perf_counter() - resolved
+
+
+def timed_connection(connection_cls, stats):
+    """Subclass a urllib3 connection class to count the sockets it opens and time DNS and connect.
+
+    urllib3 reconnects a dropped keep-alive connection on the same object, so
+    sockets are counted here rather than when the pool creates a connection.
+    The phases are timed by _timed_create_connection, which urllib3's _new_conn
+    calls in place of its own create_connection while this class opens a socket.
+    """
+    urllib3_connection.create_connection = _timed_create_connection
+
+    class TimedConnection(connection_cls):
+        def _new_conn(self):
+            _connection_phases.timing = True
+            try:
+                sock = super()._new_conn()
+            finally:
+                _connection_phases.timing = False
+            stats.record_connection()
+            return sock
+    return TimedConnection
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose connections report every socket they open"""
+
+    def __init__(self, stats, **kwargs):
+        self.stats = stats
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        stats = self.stats
+
+        def counting(pool_cls):
+            class CountingPool(pool_cls):
+                ConnectionCls = timed_connection(pool_cls.ConnectionCls, stats)
+            return CountingPool
+
+        self.poolmanager.pool_classes_by_scheme = {
+            scheme: counting(pool_cls)
+            for scheme, pool_cls in self.poolmanager.pool_classes_by_scheme.items()
+        }
+
+
+class ApiClient:
+    """Shared keep-alive HTTP session with per-host connection pooling"""
+
+    def __init__(self, base_url=BASE_URL, pool_connections=POOL_CONNECTIONS,
+                 pool_maxsize=POOL_MAXSIZE, timeout=REQUEST_TIMEOUT,
+                 pagination=READ_PAGINATION, page_size=READ_PAGE_SIZE, batch_size=BATCH_SIZE,
+                 compression=COMPRESSION):
+        self.base_url = base_url
+        self.timeout = timeout
+        self.pagination = pagination
+        self.page_size = page_size
+        self.batch_size = batch_size
+        self.batch_support = {}   # endpoint -> whether "<endpoint>/batch" exists
+        self.bulk_delete_support = {}   # endpoint -> whether DELETE on the collection exists
+        self.stats = ClientStats()
+        self.session = requests.Session()
+        self.session.headers.update(HEADERS)
+        self.compress_requests = compression == "both"
+        if compression == "off":
+            self.session.headers["Accept-Encoding"] = "identity"
+        adapter = PooledHTTPAdapter(self.stats, pool_connections=pool_connections,
+                                    pool_maxsize=pool_maxsize)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def request(self, method, endpoint, data=None, headers=None, attempt=1, instrument=True):
+        """Send a single request and return the raw response, reporting it to the instrumentation.
+
+        Byte counts are what went over the wire, i.e. after compression. Capability
+        probes pass instrument=False to stay out of the per-endpoint summary.
+        """
+        url = f"{self.base_url}/{endpoint}"
+        body, body_headers = encode_body(data, self.compress_requests)
+        if body_headers:
+            headers = {**(headers or {}), **body_headers}
+        instrumentation = get_instrumentation() if instrument else Instrumentation()
+        _reset_connection_phases()
+        started = time.perf_counter()
+        try:
+            response = self.session.request(method, url, data=body, headers=headers, timeout=self.timeout)
+        except requests.exceptions.RequestException as e:
+            if instrumentation.enabled:
+                instrumentation.emit(request_event(method, endpoint, attempt, started, error=e,
+                                                   sent=body_size(body)))
+            raise
+        sent = body_size(body)
+        content = len(response.content)
+        received = response.raw.tell() or content
+        self.stats.record_request(sent, received, reused=not _opened_connection())
+        if instrumentation.enabled:
+            instrumentation.emit(request_event(method, endpoint, attempt, started, response,
+                                               sent=sent, received=received, content=content))
+        return response
+
+    def stream(self, endpoint, chunk_size=STREAM_CHUNK_SIZE, attempt=1):
+        """GET an endpoint and yield the body as decoded text chunks without buffering it"""
+        url = f"{self.base_url}/{endpoint}"
+        content = 0
+        instrumentation = get_instrumentation()
+        _reset_connection_phases()
+        started = time.perf_counter()
+        try:
+            response = self.session.get(url, timeout=self.timeout, stream=True)
+        except requests.exceptions.RequestException as e:
+            if instrumentation.enabled:
+                instrumentation.emit(request_event("GET", endpoint, attempt, started, error=e))
+            raise
+        with response:
+            try:
+                response.raise_for_status()
+                decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")()
+                for chunk in response.iter_content(chunk_size):
+                    content += len(chunk)
+                    yield decoder.decode(chunk)
+                yield decoder.decode(b"", final=True)
+            finally:
+                received = response.raw.tell() or content
+                self.stats.record_request(0, received, reused=not _opened_connection())
+                if instrumentation.enabled:
+                    instrumentation.emit(request_event("GET", endpoint, attempt, started, response,
+                                                       sent=0, received=received, content=content))
+
+    def close(self):
+        self.session.close()
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    """Return the shared API client, creating it on first use"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = ApiClient()
+        return _client
+
+
+def configure_client(**kwargs):
+    """Replace the shared API client, e.g. to change the pool size"""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+        _client = ApiClient(**kwargs)
+        return _client
+
+
+def print_client_stats(client=None):
+    """Print connection reuse and transfer counters"""
+    stats = (client or get_client()).stats.snapshot()
+    print(f"Requests: {stats['requests']}")
+    print(f"Connections opened: {stats['connections_opened']}, reused: {stats['connections_reused']}")
+    print(f"Bytes sent: {stats['bytes_sent']}, received: {stats['bytes_received']}")
+
+
+# ---------------------------------------------------------------------------
+# Retry policy
+# ---------------------------------------------------------------------------
+
+def _find_created_character(payload):
+    for record in iter_records(f"characters/by-class/{payload['class']}"):
+        if record.get("name") == payload["name"] and record.get("level") == payload.get("level"):
+            return record
+    return None
+
+def _find_created_item_template(payload):
+    endpoint = f"itemtemplates/by-category/{payload['category']}" if payload.get("category") else "itemtemplates"
+    for record in iter_records(endpoint):
+        if record.get("name") == payload["name"]:
+            return record
+    return None
+
+def _find_created_spell_template(payload):
+    endpoint = f"spelltemplates/by-level/{payload['level']}" if "level" in payload else "spelltemplates"
+    for record in iter_records(endpoint):
+        if record.get("name") == payload["name"]:
+            return record
+    return None
+
+def _find_created_item(payload):
+    for record in iter_records(f"items/by-character/{payload['characterId']}"):
+        if record.get("itemTemplateId") == payload["itemTemplateId"]:
+            yield record
+
+def _find_created_spell(payload):
+    for record in iter_records(f"spells/by-character/{payload['characterId']}"):
+        if record.get("spellTemplateId") == payload["spellTemplateId"]:
+            yield record
+
+RECONCILE_FAILED = object()
+
+class RetryPolicy:
+    """Exponential backoff with full jitter, Retry-After support and a global retry budget.
+
+    Connection errors, timeouts, 5xx and 429 responses are retried; other 4xx
+    responses are permanent. POSTs are not idempotent: after an ambiguous failure
+    (the server may have committed it) they are reconciled before being sent again,
+    or not sent again at all when the endpoint has no reconciler.
+
+    A reconcile only accepts records with an ID above the highest one confirmed
+    before its POST was first sent (IDs are SQL Server identity values) that no
+    other request has claimed. Claimed IDs are kept only while they are above the
+    floor of some POST still in flight, so memory stays bounded by the concurrency.
+    """
+
+    RETRYABLE_STATUS = {429}
+
+    def __init__(self, attempts=RETRY_ATTEMPTS, base_delay=RETRY_BASE_DELAY, max_delay=RETRY_MAX_DELAY,
+                 budget_ratio=RETRY_BUDGET_RATIO, budget_min=RETRY_BUDGET_MIN):
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget_ratio = budget_ratio
+        self.budget_min = budget_min
+        self.reconcilers = {
+            "itemtemplates": _find_created_item_template,
+            "spelltemplates": _find_created_spell_template,
+            "characters": _find_created_character,
+            "items/from-template": _find_created_item,
+            "spells/from-template": _find_created_spell,
+        }
+        self._claimed = {}      # endpoint -> IDs created by confirmed POSTs, pruned by end()
+        self._high_water = {}   # endpoint -> highest ID a POST has confirmed
+        self._in_flight = {}    # endpoint -> floors of the reconcilable POSTs in flight
+        self._rng = random.Random()
+        self._lock = threading.Lock()
+        self.metrics = {
+            "requests": 0,
+            "attempts": 0,
+            "retries": 0,
+            "budget_denied": 0,
+            "permanent_failures": 0,
+            "exhausted": 0,
+            "reconciled": 0,
+            "reasons": {},
+        }
+
+    def record_failure(self, kind):
+        """Count a request that failed for good ("permanent_failures" or "exhausted")"""
+        with self._lock:
+            self.metrics[kind] += 1
+
+    def record_attempt(self, attempt):
+        with self._lock:
+            self.metrics["attempts"] += 1
+            if attempt == 0:
+                self.metrics["requests"] += 1
+
+    def begin(self, method, endpoint):
+        """Register a reconcilable POST about to be sent; returns its floor, or None for other requests"""
+        if method != "POST" or endpoint not in self.reconcilers:
+            return None
+        with self._lock:
+            floor = self._high_water.get(endpoint, 0)
+            self._in_flight.setdefault(endpoint, []).append(floor)
+        return floor
+
+    def end(self, endpoint, floor):
+        """Unregister a POST from begin() and forget claims no POST in flight can still find"""
+        if floor is None:
+            return
+        with self._lock:
+            floors = self._in_flight[endpoint]
+            floors.remove(floor)
+            lowest = min(floors) if floors else self._high_water.get(endpoint, 0)
+            claimed = self._claimed.get(endpoint)
+            if claimed:
+                self._claimed[endpoint] = {record_id for record_id in claimed if record_id > lowest}
+
+    def record_success(self, method, endpoint, result):
+        """Remember IDs created by non-idempotent POSTs so reconciliation never claims them twice"""
+        if method == "POST" and endpoint in self.reconcilers and isinstance(result, dict) and "id" in result:
+            with self._lock:
+                self._high_water[endpoint] = max(self._high_water.get(endpoint, 0), result["id"])
+                self._claimed.setdefault(endpoint, set()).add(result["id"])
+
+    def classify(self, error, response):
+        """Return the retry reason for a failure, or None if it is permanent"""
+        if response is not None and response.status_code >= 400:
+            if response.status_code >= 500 or response.status_code in self.RETRYABLE_STATUS:
+                return str(response.status_code)
+            return None
+        if isinstance(error, requests.exceptions.Timeout):
+            return "timeout"
+        if isinstance(error, requests.exceptions.ConnectionError):
+            return "connection"
+        return None
+
+    def is_ambiguous(self, method, error, response):
+        """True if a failed non-idempotent POST may nevertheless have been applied"""
+        if method != "POST":
+            return False
+        if isinstance(error, requests.exceptions.ConnectTimeout):
+            return False   # never reached the server
+        if response is not None:
+            return response.status_code >= 500
+        return isinstance(error, (requests.exceptions.Timeout, requests.exceptions.ConnectionError))
+
+    def acquire_retry(self, reason):
+        """Take one retry from the global budget; False once retries outgrow their share of traffic"""
+        with self._lock:
+            allowed = self.budget_min + self.budget_ratio * self.metrics["requests"]
+            if self.metrics["retries"] >= allowed:
+                self.metrics["budget_denied"] += 1
+                return False
+            self.metrics["retries"] += 1
+            self.metrics["reasons"][reason] = self.metrics["reasons"].get(reason, 0) + 1
+            return True
+
+    def delay(self, attempt, response=None):
+        """Seconds to wait before the next attempt"""
+        retry_after = self._retry_after(response)
+        if retry_after is not None:
+            return retry_after
+        return self._rng.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    @staticmethod
+    def _retry_after(response):
+        value = response.headers.get("Retry-After") if response is not None else None
+        if not value:
+            return None
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                seconds = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+            except (TypeError, ValueError):
+                return None
+        return min(max(seconds, 0.0), RETRY_AFTER_MAX)
+
+    def reconcile(self, endpoint, payload, floor):
+        """Look for a record an ambiguous POST (registered with `floor`) already created.
+
+        Returns the record, None if there is none, or RECONCILE_FAILED if the lookup itself failed.
+        """
+        try:
+            found = self.reconcilers[endpoint](payload)
+            candidates = [found] if isinstance(found, dict) else list(found or [])
+        except (requests.exceptions.RequestException, ValueError):
+            return RECONCILE_FAILED
+        with self._lock:
+            claimed = self._claimed.setdefault(endpoint, set())
+            for record in candidates:
+                record_id = record.get("id")
+                if isinstance(record_id, int) and record_id > floor and record_id not in claimed:
+                    claimed.add(record_id)
+                    self._high_water[endpoint] = max(self._high_water.get(endpoint, 0), record_id)
+                    self.metrics["reconciled"] += 1
+                    return record
+        return None
+
+
+_retry_policy = None
+
+
+def get_retry_policy():
+    """Return the shared retry policy, creating it on first use"""
+    global _retry_policy
+    if _retry_policy is None:
+        _retry_policy = RetryPolicy()
+    return _retry_policy
+
+
+def configure_retry_policy(**kwargs):
+    """Replace the shared retry policy"""
+    global _retry_policy
+    _retry_policy = RetryPolicy(**kwargs)
+    return _retry_policy
+
+
+def print_retry_stats(policy=None):
+    """Print retry counters for the run"""
+    metrics = (policy or get_retry_policy()).metrics
+    reasons = ", ".join(f"{reason}: {count}" for reason, count in sorted(metrics["reasons"].items())) or "none"
+    print(f"Retries: {metrics['retries']} ({reasons}), denied by budget: {metrics['budget_denied']}")
+    print(f"Permanent failures: {metrics['permanent_failures']}, gave up after retries: {metrics['exhausted']}, "
+          f"duplicates avoided: {metrics['reconciled']}")
+
+
+# ---------------------------------------------------------------------------
+# Response cache
+# ---------------------------------------------------------------------------
+
+# Writes to a resource also make cached reads of these resources stale
+# (e.g. a character's detail view embeds its items and spells)
+RELATED_RESOURCES = {
+    "characters": ["items", "spells"],
+    "items": ["characters"],
+    "spells": ["characters"],
+    "itemtemplates": ["items"],
+    "spelltemplates": ["spells"],
+}
+
+def resource_of(endpoint):
+    """Top-level resource of an endpoint, e.g. "itemtemplates" for "itemtemplates/categories" """
+    return endpoint.split("?", 1)[0].split("/", 1)[0].lower()
+
+class ResponseCache:
+    """LRU + TTL cache of GET responses with an optional SQLite tier.
+
+    Entries are keyed by the API base URL and the endpoint, so a cache file shared
+    between runs never answers one server with another's IDs. Expired entries
+    carrying an ETag or Last-Modified are revalidated with a conditional request
+    instead of being refetched.
+    """
+
+    def __init__(self, ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, path=CACHE_PATH,
+                 resources=CACHEABLE_RESOURCES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.resources = {resource.lower() for resource in resources}
+        self.stats = {"hits": 0, "misses": 0, "revalidated": 0, "invalidations": 0}
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        if path:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            columns = [row[1] for row in self._db.execute("PRAGMA table_info(responses)")]
+            if columns and "base_url" not in columns:
+                self._db.execute("DROP TABLE responses")   # written before entries were keyed by server
+            self._db.execute("CREATE TABLE IF NOT EXISTS responses (base_url TEXT, endpoint TEXT, "
+                             "body TEXT, etag TEXT, last_modified TEXT, expires REAL, "
+                             "PRIMARY KEY (base_url, endpoint))")
+            self._db.commit()
+
+    def cacheable(self, endpoint):
+        return self.ttl > 0 and resource_of(endpoint) in self.resources
+
+    def lookup(self, base_url, endpoint):
+        """Return the cached entry for an endpoint of the API at `base_url` (possibly expired), or None"""
+        key = (base_url, endpoint)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            elif self._db is not None:
+                row = self._db.execute("SELECT body, etag, last_modified, expires FROM responses "
+                                       "WHERE base_url = ? AND endpoint = ?", key).fetchone()
+                if row is not None:
+                    entry = {"body": json.loads(row[0]), "etag": row[1], "last_modified": row[2], "expires": row[3]}
+                    self._remember(key, entry)
+            return entry
+
+    @staticmethod
+    def is_fresh(entry):
+        return entry["expires"] > time.time()
+
+    @staticmethod
+    def conditional_headers(entry):
+        """If-None-Match / If-Modified-Since headers for revalidating an entry"""
+        headers = {}
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def count(self, stat):
+        with self._lock:
+            self.stats[stat] += 1
+
+    def store(self, base_url, endpoint, body, response):
+        entry = {
+            "body": body,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "expires": time.time() + self.ttl,
+        }
+        with self._lock:
+            self._remember((base_url, endpoint), entry)
+            self._persist((base_url, endpoint), entry)
+
+    def refresh(self, base_url, endpoint, entry):
+        """Extend an entry the server confirmed unchanged (304 Not Modified)"""
+        entry["expires"] = time.time() + self.ttl
+        with self._lock:
+            self.stats["revalidated"] += 1
+            self._remember((base_url, endpoint), entry)
+            self._persist((base_url, endpoint), entry)
+
+    def invalidate(self, endpoint):
+        """Drop every entry of the written resource and of resources embedding it, for every server"""
+        resource = resource_of(endpoint)
+        stale = {resource, *RELATED_RESOURCES.get(resource, [])} & self.resources
+        if not stale:
+            return
+        with self._lock:
+            for key in [key for key in self._entries if resource_of(key[1]) in stale]:
+                del self._entries[key]
+                self.stats["invalidations"] += 1
+            if self._db is not None:
+                for name in stale:
+                    self._db.execute("DELETE FROM responses WHERE endpoint = ? OR endpoint LIKE ? "
+                                     "OR endpoint LIKE ?", (name, f"{name}/%", f"{name}?%"))
+                self._db.commit()
+
+    def _remember(self, key, entry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _persist(self, key, entry):
+        if self._db is not None:
+            self._db.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                             (*key, json.dumps(entry["body"]), entry["etag"],
+                              entry["last_modified"], entry["expires"]))
+            self._db.commit()
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+
+
+_cache = None
+
+
+def get_cache():
+    """Return the shared response cache, creating it on first use"""
+    global _cache
+    if _cache is None:
+        _cache = ResponseCache()
+    return _cache
+
+
+def configure_cache(**kwargs):
+    """Replace the shared response cache, e.g. to enable the on-disk tier"""
+    global _cache
+    if _cache is not None:
+        _cache.close()
+    _cache = ResponseCache(**kwargs)
+    return _cache
+
+
+def print_cache_stats(cache=None):
+    """Print response cache counters"""
+    stats = (cache or get_cache()).stats
+    print(f"Cache hits: {stats['hits']}, misses: {stats['misses']}, "
+          f"revalidated: {stats['revalidated']}, invalidations: {stats['invalidations']}")
+
+
+def make_request(method, endpoint, data=None, retries=None, client=None, policy=None, use_cache=True):
+    """Make HTTP request with error handling and retry logic"""
+    client = client or get_client()
+    policy = policy or get_retry_policy()
+    attempts = retries or policy.attempts
+    
+    cache = get_cache()
+    cached = None
+    if method == "GET" and use_cache and cache.cacheable(endpoint):
+        cached = cache.lookup(client.base_url, endpoint)
+        if cached is not None and cache.is_fresh(cached):
+            cache.count("hits")
+            return copy.deepcopy(cached["body"])
+        cache.count("misses")
+    elif method != "GET":
+        cache.invalidate(endpoint)
+    
+    floor = policy.begin(method, endpoint)
+    ambiguous = False
+    try:
+        for attempt in range(attempts):
+            if ambiguous:
+                existing = policy.reconcile(endpoint, data, floor)
+                if existing is RECONCILE_FAILED:
+                    # Sending it again without knowing could create a duplicate; check again later
+                    log_record(f"Could not check whether {method} {endpoint} was applied (attempt {attempt + 1})")
+                    if attempt == attempts - 1:
+                        policy.record_failure("exhausted")
+                        log_record(f"❌ Giving up on {method} {endpoint}")
+                        return None
+                    time.sleep(policy.delay(attempt))
+                    continue
+                if existing is not None:
+                    log_record(f"↺ {method} {endpoint} had already succeeded, not sending it again")
+                    return existing
             
-            response.raise_for_status()
-            if response.content:
-                return response.json()
-            return {}
+            policy.record_attempt(attempt)
+            response = None
+            try:
+                response = client.request(method, endpoint, data, cache.conditional_headers(cached), attempt + 1)
+                
+                if response.status_code == 304 and cached is not None:
+                    cache.refresh(client.base_url, endpoint, cached)
+                    return copy.deepcopy(cached["body"])
+                
+                response.raise_for_status()
+                result = response.json() if response.content else {}
+                policy.record_success(method, endpoint, result)
+                if method == "GET" and use_cache and cache.cacheable(endpoint):
+                    cache.store(client.base_url, endpoint, copy.deepcopy(result), response)
+                return result
+                
+            except requests.exceptions.RequestException as e:
+                error = e
             
-        except requests.exceptions.Timeout:
-            print(f"⏱️  Timeout on attempt {attempt + 1} for {method} {endpoint}")
-            if attempt < retries - 1:
-                time.sleep(2)
-                continue
+            reason = policy.classify(error, response)
+            if isinstance(error, requests.exceptions.Timeout):
+                log_record(f"⏱️  Timeout on attempt {attempt + 1} for {method} {endpoint}")
             else:
-                print(f"❌ Final timeout for {method} {endpoint}")
+                log_record(f"Error making {method} request to {endpoint} (attempt {attempt + 1}): {error}")
+                if response is not None and response.text:
+                    log_record(f"Response: {response.text}")
+            
+            if reason is None:
+                policy.record_failure("permanent_failures")
                 return None
-                
+            if attempt == attempts - 1 or not policy.acquire_retry(reason):
+                policy.record_failure("exhausted")
+                log_record(f"❌ Giving up on {method} {endpoint}")
+                return None
+            
+            ambiguous = ambiguous or policy.is_ambiguous(method, error, response)
+            if ambiguous and floor is None:
+                # Nothing can tell whether it was applied; sending it again could create a duplicate
+                policy.record_failure("exhausted")
+                log_record(f"❌ Not resending {method} {endpoint}: it may already have been applied")
+                return None
+            time.sleep(policy.delay(attempt, response))
+        
+        return None
+    finally:
+        policy.end(endpoint, floor)
+
+def stream_get(endpoint, client=None, policy=None):
+    """Yield the decoded body of a GET like ApiClient.stream, with the retry policy of make_request.
+
+    Failures before the first chunk (connection errors, timeouts, 5xx and 429
+    responses) are retried with backoff; once records have been handed to the
+    caller a failure is raised, as resending would repeat them.
+    """
+    client = client or get_client()
+    policy = policy or get_retry_policy()
+    for attempt in range(policy.attempts):
+        policy.record_attempt(attempt)
+        chunks = client.stream(endpoint, attempt=attempt + 1)
+        try:
+            first = next(chunks)
         except requests.exceptions.RequestException as e:
-            print(f"Error making {method} request to {endpoint} (attempt {attempt + 1}): {e}")
-            if hasattr(e, 'response') and hasattr(e.response, 'text'):
-                print(f"Response: {e.response.text}")
-            if attempt < retries - 1:
-                time.sleep(1)
+            error = e
+        else:
+            yield first
+            yield from chunks
+            return
+        
+        response = getattr(error, "response", None)
+        reason = policy.classify(error, response)
+        log_record(f"Error reading {endpoint} (attempt {attempt + 1}): {error}")
+        if reason is None:
+            policy.record_failure("permanent_failures")
+            raise error
+        if attempt == policy.attempts - 1 or not policy.acquire_retry(reason):
+            policy.record_failure("exhausted")
+            raise error
+        time.sleep(policy.delay(attempt, response))
+
+def iter_json_array(chunks):
+    """Incrementally parse a top-level JSON array from text chunks, yielding one element at a time"""
+    decoder = json.JSONDecoder()
+    buffer = ""
+    started = False
+    chunks = iter(chunks)
+    exhausted = False
+    
+    while not exhausted:
+        chunk = next(chunks, None)
+        if chunk is None:
+            exhausted = True
+        else:
+            buffer += chunk
+        
+        pos = 0
+        length = len(buffer)
+        while True:
+            while pos < length and buffer[pos] in " \t\r\n,":
+                pos += 1
+            if pos >= length:
+                break
+            if not started:
+                if buffer[pos] != "[":
+                    raise ValueError("Expected a JSON array")
+                started = True
+                pos += 1
                 continue
-            return None
+            if buffer[pos] == "]":
+                return
+            try:
+                element, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if exhausted:
+                    raise
+                break   # element continues in the next chunk
+            if end == length and not exhausted:
+                break   # a number could still be cut off, wait for more data
+            yield element
+            pos = end
+        buffer = buffer[pos:]
     
-    return None
+    if started:
+        raise ValueError("Unterminated JSON array")
+
+def _paged_endpoint(endpoint, query):
+    separator = "&" if "?" in endpoint else "?"
+    return f"{endpoint}{separator}{query}"
+
+def iter_records(endpoint, client=None):
+    """Yield the records of a collection endpoint one at a time, paging when the client is configured to.
+
+    A server that ignores the paging parameters returns more than one page worth of
+    records at once; that response is streamed as the complete collection.
+    """
+    client = client or get_client()
+    if not client.pagination:
+        yield from iter_json_array(stream_get(endpoint, client))
+        return
+    
+    page_size = client.page_size
+    keyset = client.pagination == "keyset"
+    page = 1
+    after_id = 0
+    first_id = None
+    while True:
+        if keyset:
+            url = _paged_endpoint(endpoint, f"afterId={after_id}&limit={page_size}")
+        else:
+            url = _paged_endpoint(endpoint, f"page={page}&pageSize={page_size}")
+        
+        count = 0
+        requested_after_id = after_id
+        with contextlib.closing(stream_get(url, client)) as chunks:
+            for record in iter_json_array(chunks):
+                record_id = record.get("id") if isinstance(record, dict) else None
+                if not count and page > 1 and record_id is not None and (
+                        record_id <= requested_after_id if keyset else record_id == first_id):
+                    # The server ignored the paging parameters and sent the first page again
+                    return
+                if not count:
+                    first_id = record_id
+                count += 1
+                if record_id is not None:
+                    after_id = max(after_id, record_id)
+                yield record
+        
+        if count != page_size or (keyset and after_id == requested_after_id):
+            return
+        page += 1
+
+def check_connection():
+    """Return True if the API answers a characters request, reading only the first record"""
+    records = iter_records("characters")
+    try:
+        next(records, None)
+        return True
+    except (requests.exceptions.RequestException, ValueError):
+        return False
+    finally:
+        records.close()
+
+# ---------------------------------------------------------------------------
+# Parallel execution
+# ---------------------------------------------------------------------------
+
+class TokenBucket:
+    """Thread-safe token bucket limiting calls to `rate` per second"""
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class ParallelRunner:
+    """Runs calls on a thread pool with bounded concurrency and optional rate limiting"""
+
+    def __init__(self, concurrency=SEED_CONCURRENCY, rate_limit=SEED_RATE_LIMIT):
+        self.concurrency = max(1, concurrency)
+        self.limiter = TokenBucket(rate_limit) if rate_limit else None
+
+    def _call(self, func, item):
+        if self.limiter:
+            self.limiter.acquire()
+        return func(item)
+
+    def map(self, func, iterable):
+        """Apply func to every item, yielding results in input order"""
+        if self.concurrency == 1:
+            for item in iterable:
+                yield self._call(func, item)
+            return
+
+        # Only keep a small window of futures in flight so huge inputs stay lazy
+        window = self.concurrency * 2
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            pending = deque()
+            for item in iterable:
+                pending.append(pool.submit(self._call, func, item))
+                if len(pending) >= window:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+
+_runner = None
+
+
+def get_runner():
+    """Return the shared seeding runner, creating it on first use"""
+    global _runner
+    if _runner is None:
+        _runner = ParallelRunner()
+    return _runner
+
+
+def configure_runner(**kwargs):
+    """Replace the shared seeding runner, e.g. to change concurrency"""
+    global _runner
+    _runner = ParallelRunner(**kwargs)
+    return _runner
+
+
+def name_key(payload):
+    """Natural key of templates and characters"""
+    return payload['name']
+
+def _post_keyed(endpoint, keyed, journal=None):
+    """POST (key, payload) pairs one record per request, yielding (payload, result) in input order"""
+    def create(item):
+        record_key, payload = item
+        if journal is not None:
+            done = journal.get(endpoint, record_key)
+            if done is not None:
+                return payload, done
+        result = make_request("POST", endpoint, payload)
+        if result and journal is not None:
+            journal.record(endpoint, record_key, result)
+        return payload, result
+    
+    return get_runner().map(create, keyed)
+
+def _keyed(payloads, journal, key):
+    # Keys are computed in the submitting thread so stateful key functions stay ordered
+    return ((key(payload) if journal is not None else None, payload) for payload in payloads)
+
+def post_all(endpoint, payloads, journal=None, key=name_key):
+    """POST every payload through the shared runner, yielding (payload, result) in input order.
+
+    With a journal, payloads whose key was already confirmed are not sent again;
+    the journaled record is yielded instead.
+    """
+    return _post_keyed(endpoint, _keyed(payloads, journal, key), journal)
+
+BATCH_UNSUPPORTED = object()
+
+def post_batch(endpoint, payloads, client=None):
+    """POST a list of payloads to "<endpoint>/batch" in one request.
+
+    Returns the created records aligned with the payloads (None for failures), or
+    BATCH_UNSUPPORTED when the backend has no batch endpoint. Batches are not
+    retried: a timed-out batch may have been committed, and resending it would
+    duplicate every record in it.
+    """
+    client = client or get_client()
+    get_cache().invalidate(endpoint)
+    try:
+        response = client.request("POST", f"{endpoint}/batch", payloads)
+    except requests.exceptions.RequestException as e:
+        print(f"Error posting batch of {len(payloads)} to {endpoint}: {e}")
+        return [None] * len(payloads)
+    
+    if response.status_code in (404, 405):
+        return BATCH_UNSUPPORTED
+    try:
+        response.raise_for_status()
+        created = response.json()
+    except (requests.exceptions.RequestException, ValueError) as e:
+        print(f"Error posting batch of {len(payloads)} to {endpoint}: {e}")
+        return [None] * len(payloads)
+    
+    if not isinstance(created, list) or len(created) != len(payloads):
+        print(f"✗ Batch response for {endpoint} does not match the {len(payloads)} records sent")
+        return [None] * len(payloads)
+    return created
+
+def probe_batch_support(endpoint, client=None):
+    """Send an empty batch to find out whether "<endpoint>/batch" exists"""
+    client = client or get_client()
+    try:
+        response = client.request("POST", f"{endpoint}/batch", [], instrument=False)
+    except requests.exceptions.RequestException:
+        return False
+    # An existing endpoint may accept the empty list or reject it as invalid
+    return response.ok or response.status_code in (400, 422)
+
+def post_batches(endpoint, payloads, batch_size, journal=None, key=name_key):
+    """Create records in batches of `batch_size`, yielding (payload, result) in input order.
+
+    If the backend has no batch endpoint, the records fall back to concurrent single POSTs.
+    """
+    client = get_client()
+    keyed = _keyed(payloads, journal, key)
+    
+    def send(chunk):
+        results = [journal.get(endpoint, record_key) if journal is not None else None
+                   for record_key, _ in chunk]
+        pending = [index for index, result in enumerate(results) if result is None]
+        if pending:
+            created = post_batch(endpoint, [chunk[index][1] for index in pending], client)
+            if created is BATCH_UNSUPPORTED:
+                client.batch_support[endpoint] = False
+                created = [make_request("POST", endpoint, chunk[index][1]) for index in pending]
+            for index, record in zip(pending, created):
+                results[index] = record
+                if record and journal is not None:
+                    journal.record(endpoint, chunk[index][0], record)
+        return [(payload, result) for (_, payload), result in zip(chunk, results)]
+    
+    def chunks():
+        while True:
+            chunk = list(itertools.islice(keyed, batch_size))
+            if not chunk:
+                return
+            yield chunk
+    
+    if client.batch_support.get(endpoint) is None:
+        client.batch_support[endpoint] = probe_batch_support(endpoint, client)
+    
+    if client.batch_support.get(endpoint) is False:
+        yield from _post_keyed(endpoint, keyed, journal)
+        return
+    for results in get_runner().map(send, chunks()):
+        yield from results
+
+_throughput = []
+
+def create_records(endpoint, payloads, journal=None, key=name_key):
+    """Create records in batches or one POST each, per the client's batch size, timing the run"""
+    client = get_client()
+    start = time.perf_counter()
+    count = created = 0
+    if client.batch_size > 1:
+        results = post_batches(endpoint, payloads, client.batch_size, journal, key)
+    else:
+        results = post_all(endpoint, payloads, journal, key)
+    
+    for payload, result in results:
+        count += 1
+        created += 1 if result else 0
+        yield payload, result
+    
+    mode = "batch" if client.batch_support.get(endpoint) else "single"
+    _throughput.append((endpoint, mode, created, count, time.perf_counter() - start))
+
+def print_throughput():
+    """Print creation throughput per endpoint and mode"""
+    print(f"{'Endpoint':<22} {'mode':<7} {'created/sent':>17} {'time':>9} {'rate':>14}")
+    for endpoint, mode, created, count, elapsed in _throughput:
+        rate = created / elapsed if elapsed > 0 else 0
+        print(f"{endpoint:<22} {mode:<7} {created:>8}/{count:<8} {elapsed:>8.2f}s {rate:>10.1f} rec/s")
+
+def occurrence_key(*fields):
+    """Key function for payloads without a natural name, numbering repeated field combinations"""
+    seen = {}
+    
+    def key(payload):
+        base = ":".join(str(payload[field]) for field in fields)
+        seen[base] = seen.get(base, 0) + 1
+        return f"{base}#{seen[base]}"
+    return key
+
+# ---------------------------------------------------------------------------
+# Checkpoint journal
+# ---------------------------------------------------------------------------
+
+class SeedJournal:
+    """Append-only JSONL journal mapping each created record's natural key to its server ID"""
+
+    def __init__(self, path, batch_size=JOURNAL_BATCH_SIZE, resume=True):
+        self.path = path
+        self.batch_size = batch_size
+        self.records = {}
+        self.resumed = 0
+        self._buffer = []
+        self._lock = threading.Lock()
+        torn = False
+        if resume and os.path.exists(path):
+            torn = self._load()
+        self._handle = open(path, "a" if resume else "w", encoding="utf-8")
+        if torn:
+            self._handle.write("\n")
+
+    def _load(self):
+        """Read confirmed records; returns True if the last line was cut off mid-write"""
+        line = "\n"
+        with open(self.path, encoding="utf-8") as handle:
+            for line in handle:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue   # a torn last line from an interrupted run
+                self.records[(entry["endpoint"], entry["key"])] = {"id": entry["id"], "name": entry.get("name")}
+        return not line.endswith("\n")
+
+    def __len__(self):
+        return len(self.records)
+
+    def get(self, endpoint, key):
+        """Return the journaled record for a key, or None if it still has to be created"""
+        record = self.records.get((endpoint, key))
+        if record is not None:
+            with self._lock:
+                self.resumed += 1
+        return record
+
+    def record(self, endpoint, key, result):
+        """Remember a confirmed record; it reaches disk with the next batch"""
+        entry = {"endpoint": endpoint, "key": key, "id": result["id"], "name": result.get("name")}
+        with self._lock:
+            self.records[(endpoint, key)] = {"id": entry["id"], "name": entry["name"]}
+            self._buffer.append(json.dumps(entry))
+            if len(self._buffer) >= self.batch_size:
+                self._flush_locked()
+
+    def _flush_locked(self):
+        if self._buffer:
+            self._handle.write("\n".join(self._buffer) + "\n")
+            self._handle.flush()
+            self._buffer = []
+
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+
+    def close(self):
+        """Write any buffered entries and fsync the journal once"""
+        with self._lock:
+            self._flush_locked()
+            os.fsync(self._handle.fileno())
+            self._handle.close()
+
+# ---------------------------------------------------------------------------
+# Clearing
+# ---------------------------------------------------------------------------
+
+# Resources wiped by clear_database, in dependency order. Items and spells are not
+# listed: AppDbContext configures Character -> Items/Spells with
+# OnDelete(DeleteBehavior.Cascade), so deleting the characters removes them too.
+CLEAR_ORDER = ["characters", "spelltemplates", "itemtemplates"]
+
+def try_bulk_delete(endpoint):
+    """Try a collection-level DELETE; returns False when the backend has no such endpoint.
+
+    The first DELETE per client doubles as the probe and is left out of the
+    instrumentation, so a backend without the endpoint (the API answers 405)
+    costs one unreported request per run instead of an error row in the summary.
+    """
+    client = get_client()
+    supported = client.bulk_delete_support.get(endpoint)
+    if supported is False:
+        return False
+    get_cache().invalidate(endpoint)
+    try:
+        response = client.request("DELETE", endpoint, instrument=supported is not None)
+    except requests.exceptions.RequestException:
+        return False
+    if response.status_code in (404, 405):
+        client.bulk_delete_support[endpoint] = False
+    elif response.ok:
+        client.bulk_delete_support[endpoint] = True
+    return response.ok
+
+def clear_endpoint(endpoint):
+    """Delete every record of one resource, returning (deleted, seconds, error or None)"""
+    start = time.perf_counter()
+    
+    if try_bulk_delete(endpoint):
+        print(f"✓ Bulk-deleted all {endpoint}")
+        return None, time.perf_counter() - start, None
+    
+    def delete(record):
+        return record, make_request("DELETE", f"{endpoint}/{record['id']}")
+    
+    # Repeat until a pass finds nothing: with page-based pagination, deleting
+    # records while paging shifts later pages, so one pass may miss some.
+    deleted = 0
+    while True:
+        records = (record for record in iter_records(endpoint) if 'id' in record)
+        seen = deleted_this_pass = 0
+        try:
+            for record, result in get_runner().map(delete, records):
+                seen += 1
+                if result is not None:
+                    deleted_this_pass += 1
+                    log_record(f"✓ Deleted {endpoint}: {record.get('name', record['id'])}")
+        except (requests.exceptions.RequestException, ValueError) as e:
+            return deleted + deleted_this_pass, time.perf_counter() - start, f"error reading {endpoint}: {e}"
+        deleted += deleted_this_pass
+        if not seen:
+            return deleted, time.perf_counter() - start, None
+        if not deleted_this_pass:
+            return deleted, time.perf_counter() - start, f"{seen} {endpoint} could not be deleted"
 
 def clear_database():
-    """Clear all existing data"""
+    """Clear all existing data; returns False, after reporting why, if any of it is left"""
     print("🗑️  Clearing existing data...")
     
-    endpoints_to_clear = ["spells", "items", "characters", "spelltemplates", "itemtemplates"]
+    throughput = []
+    for endpoint in CLEAR_ORDER:
+        deleted, elapsed, error = clear_endpoint(endpoint)
+        if error is not None:
+            print(f"❌ Database not cleared: {error}")
+            return False
+        throughput.append((endpoint, deleted, elapsed))
     
-    for endpoint in endpoints_to_clear:
-        records = make_request("GET", endpoint)
-        if records:
-            for record in records:
-                if 'id' in record:
-                    result = make_request("DELETE", f"{endpoint}/{record['id']}")
-                    if result is not None:
-                        print(f"✓ Deleted {endpoint}: {record.get('name', record['id'])}")
+    for endpoint, deleted, elapsed in throughput:
+        if deleted is None:
+            print(f"   {endpoint}: bulk delete in {elapsed:.2f}s")
+        else:
+            rate = deleted / elapsed if elapsed > 0 else 0
+            print(f"   {endpoint}: {deleted} deleted in {elapsed:.2f}s ({rate:.1f}/s)")
     
     print("✅ Database cleared!")
+    return True
+
+# ---------------------------------------------------------------------------
+# Fixture data - the hand-written "fixture" profile (20 records per table)
+# ---------------------------------------------------------------------------
+
+FIXTURE_ITEM_TEMPLATES = [
+    # Weapons
+    {"name": "Excalibur", "effect": "The legendary sword of King Arthur.", "strengthBonus": 5, "charismaBonus": 3, "category": "Weapon", "isActive": True},
+    {"name": "Mjolnir", "effect": "Thor's mighty hammer.", "strengthBonus": 6, "constitutionBonus": 3, "category": "Weapon", "isActive": True},
+    {"name": "Gungnir", "effect": "Odin's spear that never misses.", "dexterityBonus": 4, "wisdomBonus": 3, "category": "Weapon", "isActive": True},
+    {"name": "Dragonslayer Sword", "effect": "Forged to slay dragons.", "strengthBonus": 4, "category": "Weapon", "isActive": True},
+    {"name": "Elven Longbow", "effect": "Masterfully crafted elven bow.", "dexterityBonus": 4, "category": "Weapon", "isActive": True},
+    {"name": "Staff of Elements", "effect": "Controls elemental forces.", "intelligenceBonus": 4, "wisdomBonus": 2, "category": "Weapon", "isActive": True},
+    {"name": "Shadow Daggers", "effect": "Twin daggers of shadow.", "dexterityBonus": 5, "category": "Weapon", "isActive": True},
+
+    # Armor
+    {"name": "Dragon Scale Mail", "effect": "Armor from dragon scales.", "armorBonus": 10, "constitutionBonus": 3, "category": "Armor", "isActive": True},
+    {"name": "Celestial Plate", "effect": "Blessed by celestial beings.", "armorBonus": 9, "wisdomBonus": 2, "charismaBonus": 2, "category": "Armor", "isActive": True},
+    {"name": "Shadowsilk Robes", "effect": "Woven from shadow and moonlight.", "armorBonus": 2, "dexterityBonus": 3, "category": "Armor", "isActive": True},
+    {"name": "Adamantine Plate", "effect": "Nearly indestructible armor.", "armorBonus": 11, "category": "Armor", "isActive": True},
+    {"name": "Archmage Vestments", "effect": "Ultimate magical robes.", "armorBonus": 3, "intelligenceBonus": 5, "wisdomBonus": 2, "category": "Armor", "isActive": True},
+    {"name": "Leather of Agility", "effect": "Enhances movement and flexibility.", "armorBonus": 4, "dexterityBonus": 3, "category": "Armor", "isActive": True},
+
+    # Accessories
+    {"name": "Ring of Power", "effect": "One ring to rule them all.", "strengthBonus": 2, "dexterityBonus": 2, "constitutionBonus": 2, "intelligenceBonus": 2, "wisdomBonus": 2, "charismaBonus": 2, "category": "Accessory", "isActive": True},
+    {"name": "Amulet of Life", "effect": "Protects against death magic.", "constitutionBonus": 4, "wisdomBonus": 2, "category": "Accessory", "isActive": True},
+    {"name": "Boots of Speed", "effect": "Greatly increases movement speed.", "dexterityBonus": 4, "category": "Accessory", "isActive": True},
+    {"name": "Gauntlets of Strength", "effect": "Grants incredible physical power.", "strengthBonus": 6, "category": "Accessory", "isActive": True},
+    {"name": "Cloak of Protection", "effect": "Provides magical protection.", "armorBonus": 3, "constitutionBonus": 2, "category": "Accessory", "isActive": True},
+    {"name": "Crown of Wisdom", "effect": "Enhances mental faculties.", "intelligenceBonus": 4, "wisdomBonus": 4, "category": "Accessory", "isActive": True},
+    {"name": "Belt of Giant Strength", "effect": "Grants the strength of giants.", "strengthBonus": 5, "constitutionBonus": 2, "category": "Accessory", "isActive": True}
+]
+
+FIXTURE_SPELL_TEMPLATES = [
+    # Cantrips
+    {"name": "Fire Bolt", "effect": "A mote of fire streaks toward target.", "damage": "1d10", "level": 0, "school": "Evocation", "castingTime": "1 action", "range": "120 feet", "components": "V, S", "duration": "Instantaneous", "isActive": True},
+    {"name": "Mage Hand", "effect": "A spectral hand appears.", "level": 0, "school": "Conjuration", "castingTime": "1 action", "range": "30 feet", "components": "V, S", "duration": "1 minute", "isActive": True},
+    {"name": "Minor Illusion", "effect": "Create a sound or image.", "level": 0, "school": "Illusion", "castingTime": "1 action", "range": "30 feet", "components": "S, M", "duration": "1 minute", "isActive": True},
+    {"name": "Eldritch Blast", "effect": "A crackling beam of energy.", "damage": "1d10", "level": 0, "school": "Evocation", "castingTime": "1 action", "range": "120 feet", "components": "V, S", "duration": "Instantaneous", "isActive": True},
+    {"name": "Sacred Flame", "effect": "Radiance descends on target.", "damage": "1d8", "level": 0, "school": "Evocation", "castingTime": "1 action", "range": "60 feet", "components": "V, S", "duration": "Instantaneous", "isActive": True},
+
+    # Level 1-3
+    {"name": "Magic Missile", "effect": "Three darts of magical force.", "damage": "1d4+1", "level": 1, "school": "Evocation", "castingTime": "1 action", "range": "120 feet", "components": "V, S", "duration": "Instantaneous", "isActive": True},
+    {"name": "Healing Word", "effect": "Heal a creature with a word.", "damage": "1d4+mod", "level": 1, "school": "Evocation", "castingTime": "1 bonus action", "range": "60 feet", "components": "V", "duration": "Instantaneous", "isActive": True},
+    {"name": "Shield", "effect": "Invisible barrier protects you.", "level": 1, "school": "Abjuration", "castingTime": "1 reaction", "range": "Self", "components": "V, S", "duration": "1 round", "isActive": True},
+    {"name": "Burning Hands", "effect": "Flames shoot from fingertips.", "damage": "3d6", "level": 1, "school": "Evocation", "castingTime": "1 action", "range": "Self (15-foot cone)", "components": "V, S", "duration": "Instantaneous", "isActive": True},
+    {"name": "Cure Wounds", "effect": "Touch heals hit points.", "damage": "1d8+mod", "level": 1, "school": "Evocation", "castingTime": "1 action", "range": "Touch", "components": "V, S", "duration": "Instantaneous", "isActive": True},
+    {"name": "Invisibility", "effect": "Become invisible.", "level": 2, "school": "Illusion", "castingTime": "1 action", "range": "Touch", "components": "V, S, M", "duration": "Concentration, up to 1 hour", "isActive": True},
+    {"name": "Misty Step", "effect": "Teleport up to 30 feet.", "level": 2, "school": "Conjuration", "castingTime": "1 bonus action", "range": "Self", "components": "V", "duration": "Instantaneous", "isActive": True},
+    {"name": "Fireball", "effect": "Explosion of flame.", "damage": "8d6", "level": 3, "school": "Evocation", "castingTime": "1 action", "range": "150 feet", "components": "V, S, M", "duration": "Instantaneous", "isActive": True},
+    {"name": "Lightning Bolt", "effect": "Line of lightning.", "damage": "8d6", "level": 3, "school": "Evocation", "castingTime": "1 action", "range": "Self (100-foot line)", "components": "V, S, M", "duration": "Instantaneous", "isActive": True},
+    {"name": "Counterspell", "effect": "Interrupt spellcasting.", "level": 3, "school": "Abjuration", "castingTime": "1 reaction", "range": "60 feet", "components": "S", "duration": "Instantaneous", "isActive": True},
+
+    # High Level
+    {"name": "Dimension Door", "effect": "Teleport anywhere in range.", "level": 4, "school": "Conjuration", "castingTime": "1 action", "range": "500 feet", "components": "V", "duration": "Instantaneous", "isActive": True},
+    {"name": "Polymorph", "effect": "Transform into a beast.", "level": 4, "school": "Transmutation", "castingTime": "1 action", "range": "60 feet", "components": "V, S, M", "duration": "Concentration, up to 1 hour", "isActive": True},
+    {"name": "Telekinesis", "effect": "Move objects with your mind.", "level": 5, "school": "Transmutation", "castingTime": "1 action", "range": "60 feet", "components": "V, S", "duration": "Concentration, up to 10 minutes", "isActive": True},
+    {"name": "Chain Lightning", "effect": "Lightning arcs between targets.", "damage": "10d8", "level": 6, "school": "Evocation", "castingTime": "1 action", "range": "150 feet", "components": "V, S, M", "duration": "Instantaneous", "isActive": True},
+    {"name": "Time Stop", "effect": "Stop time briefly.", "level": 9, "school": "Transmutation", "castingTime": "1 action", "range": "Self", "components": "V", "duration": "Instantaneous", "isActive": True}
+]
+
+FIXTURE_CHARACTERS = [
+    {"name": "Gandalf the Grey", "class": "Wizard", "level": 15, "armorClass": 12, "strength": 10, "dexterity": 11, "constitution": 12, "intelligence": 20, "wisdom": 18, "charisma": 16},
+    {"name": "Aragorn", "class": "Ranger", "level": 12, "armorClass": 18, "strength": 16, "dexterity": 18, "constitution": 15, "intelligence": 14, "wisdom": 16, "charisma": 14},
+    {"name": "Legolas", "class": "Ranger", "level": 10, "armorClass": 16, "strength": 12, "dexterity": 20, "constitution": 14, "intelligence": 13, "wisdom": 18, "charisma": 15},
+    {"name": "Gimli", "class": "Fighter", "level": 11, "armorClass": 20, "strength": 18, "dexterity": 10, "constitution": 18, "intelligence": 10, "wisdom": 12, "charisma": 11},
+    {"name": "Merlin", "class": "Wizard", "level": 20, "armorClass": 14, "strength": 8, "dexterity": 12, "constitution": 14, "intelligence": 20, "wisdom": 19, "charisma": 17},
+    {"name": "Robin Hood", "class": "Rogue", "level": 8, "armorClass": 15, "strength": 12, "dexterity": 20, "constitution": 13, "intelligence": 14, "wisdom": 16, "charisma": 15},
+    {"name": "Conan", "class": "Barbarian", "level": 9, "armorClass": 16, "strength": 20, "dexterity": 16, "constitution": 18, "intelligence": 10, "wisdom": 11, "charisma": 12},
+    {"name": "Elara Moonwhisper", "class": "Cleric", "level": 7, "armorClass": 17, "strength": 13, "dexterity": 11, "constitution": 15, "intelligence": 14, "wisdom": 20, "charisma": 16},
+    {"name": "Zara Nightblade", "class": "Rogue", "level": 13, "armorClass": 17, "strength": 10, "dexterity": 20, "constitution": 14, "intelligence": 16, "wisdom": 15, "charisma": 12},
+    {"name": "Thorin Ironforge", "class": "Fighter", "level": 14, "armorClass": 19, "strength": 18, "dexterity": 12, "constitution": 17, "intelligence": 11, "wisdom": 13, "charisma": 10},
+    {"name": "Luna Starweaver", "class": "Sorcerer", "level": 11, "armorClass": 13, "strength": 8, "dexterity": 16, "constitution": 13, "intelligence": 15, "wisdom": 12, "charisma": 20},
+    {"name": "Finn the Bold", "class": "Bard", "level": 9, "armorClass": 14, "strength": 10, "dexterity": 16, "constitution": 12, "intelligence": 14, "wisdom": 13, "charisma": 18},
+    {"name": "Brother Marcus", "class": "Monk", "level": 10, "armorClass": 16, "strength": 12, "dexterity": 18, "constitution": 15, "intelligence": 13, "wisdom": 20, "charisma": 11},
+    {"name": "Draven Shadowmere", "class": "Warlock", "level": 12, "armorClass": 15, "strength": 10, "dexterity": 14, "constitution": 16, "intelligence": 15, "wisdom": 12, "charisma": 20},
+    {"name": "Gaia Earthsong", "class": "Druid", "level": 13, "armorClass": 14, "strength": 12, "dexterity": 15, "constitution": 16, "intelligence": 13, "wisdom": 20, "charisma": 14},
+    {"name": "Sir Galahad", "class": "Paladin", "level": 16, "armorClass": 20, "strength": 18, "dexterity": 10, "constitution": 16, "intelligence": 12, "wisdom": 15, "charisma": 18},
+    {"name": "Tempest Stormborn", "class": "Sorcerer", "level": 14, "armorClass": 15, "strength": 9, "dexterity": 17, "constitution": 15, "intelligence": 16, "wisdom": 13, "charisma": 20},
+    {"name": "Kael Swiftstrike", "class": "Ranger", "level": 11, "armorClass": 16, "strength": 14, "dexterity": 20, "constitution": 15, "intelligence": 12, "wisdom": 17, "charisma": 13},
+    {"name": "Morgana Le Fay", "class": "Wizard", "level": 18, "armorClass": 16, "strength": 8, "dexterity": 14, "constitution": 13, "intelligence": 20, "wisdom": 16, "charisma": 17},
+    {"name": "Bjorn Bloodaxe", "class": "Barbarian", "level": 12, "armorClass": 15, "strength": 20, "dexterity": 14, "constitution": 19, "intelligence": 8, "wisdom": 10, "charisma": 11}
+]
+
+# Assign specific items to every fixture character
+FIXTURE_ITEM_ASSIGNMENTS = [
+    {"char_idx": 0, "item": "Staff of Elements"},      # Gandalf
+    {"char_idx": 1, "item": "Elven Longbow"},          # Aragorn  
+    {"char_idx": 2, "item": "Elven Longbow"},          # Legolas
+    {"char_idx": 3, "item": "Mjolnir"},                # Gimli
+    {"char_idx": 4, "item": "Archmage Vestments"},     # Merlin
+    {"char_idx": 5, "item": "Shadow Daggers"},         # Robin Hood
+    {"char_idx": 6, "item": "Dragonslayer Sword"},     # Conan
+    {"char_idx": 7, "item": "Celestial Plate"},        # Elara
+    {"char_idx": 8, "item": "Shadowsilk Robes"},       # Zara
+    {"char_idx": 9, "item": "Adamantine Plate"},       # Thorin
+    {"char_idx": 10, "item": "Ring of Power"},         # Luna
+    {"char_idx": 11, "item": "Crown of Wisdom"},       # Finn
+    {"char_idx": 12, "item": "Gauntlets of Strength"}, # Marcus
+    {"char_idx": 13, "item": "Cloak of Protection"},   # Draven
+    {"char_idx": 14, "item": "Amulet of Life"},        # Gaia
+    {"char_idx": 15, "item": "Excalibur"},             # Galahad
+    {"char_idx": 16, "item": "Belt of Giant Strength"}, # Tempest
+    {"char_idx": 17, "item": "Boots of Speed"},        # Kael
+    {"char_idx": 18, "item": "Dragon Scale Mail"},     # Morgana
+    {"char_idx": 19, "item": "Gungnir"}                # Bjorn
+]
+
+# Assign spells to spellcasting characters
+FIXTURE_SPELL_ASSIGNMENTS = [
+    {"char_idx": 0, "spell": "Fireball"},         # Gandalf
+    {"char_idx": 0, "spell": "Lightning Bolt"},   # Gandalf
+    {"char_idx": 4, "spell": "Time Stop"},        # Merlin
+    {"char_idx": 4, "spell": "Chain Lightning"},  # Merlin
+    {"char_idx": 7, "spell": "Healing Word"},     # Elara
+    {"char_idx": 7, "spell": "Cure Wounds"},      # Elara
+    {"char_idx": 10, "spell": "Magic Missile"},   # Luna
+    {"char_idx": 10, "spell": "Invisibility"},    # Luna
+    {"char_idx": 11, "spell": "Minor Illusion"},  # Finn
+    {"char_idx": 11, "spell": "Misty Step"},      # Finn
+    {"char_idx": 13, "spell": "Eldritch Blast"},  # Draven
+    {"char_idx": 13, "spell": "Counterspell"},    # Draven
+    {"char_idx": 14, "spell": "Cure Wounds"},     # Gaia
+    {"char_idx": 14, "spell": "Polymorph"},       # Gaia
+    {"char_idx": 15, "spell": "Sacred Flame"},    # Galahad
+    {"char_idx": 15, "spell": "Shield"},          # Galahad
+    {"char_idx": 16, "spell": "Fire Bolt"},       # Tempest
+    {"char_idx": 16, "spell": "Dimension Door"},  # Tempest
+    {"char_idx": 18, "spell": "Telekinesis"},     # Morgana
+    {"char_idx": 18, "spell": "Burning Hands"}    # Morgana
+]
+
+# ---------------------------------------------------------------------------
+# Synthetic data - deterministic generators for the "synthetic" profile
+# ---------------------------------------------------------------------------
+
+CHARACTER_CLASSES = ["Barbarian", "Bard", "Cleric", "Druid", "Fighter", "Monk",
+                     "Paladin", "Ranger", "Rogue", "Sorcerer", "Warlock", "Wizard"]
+SPELL_SCHOOLS = ["Abjuration", "Conjuration", "Divination", "Enchantment",
+                 "Evocation", "Illusion", "Necromancy", "Transmutation"]
+ITEM_CATEGORIES = ["Weapon", "Armor", "Accessory"]
+
+STAT_FIELDS = ["strength", "dexterity", "constitution", "intelligence", "wisdom", "charisma"]
+MAX_TOTAL_STATS = 90   # CharacterService.ValidateCharacterStats
+MAX_POSITIVE_BONUS = 15  # ItemTemplateService.ValidateItemTemplateDataCommon
+
+NAME_PREFIXES = ["Ael", "Bran", "Cor", "Dra", "El", "Fen", "Gor", "Hal", "Isa", "Jor",
+                 "Kae", "Lor", "Mor", "Nym", "Or", "Pyr", "Quin", "Ryn", "Syl", "Thal"]
+NAME_SUFFIXES = ["dor", "wyn", "mir", "ric", "thas", "riel", "gar", "lith", "von", "zar"]
+ITEM_ADJECTIVES = ["Ancient", "Blessed", "Cursed", "Gleaming", "Runed", "Shadow",
+                   "Storm", "Frost", "Ember", "Verdant"]
+ITEM_NOUNS = {
+    "Weapon": ["Sword", "Axe", "Bow", "Dagger", "Mace", "Spear", "Staff", "Hammer"],
+    "Armor": ["Plate", "Mail", "Robes", "Leathers", "Shield", "Helm"],
+    "Accessory": ["Ring", "Amulet", "Cloak", "Boots", "Belt", "Crown"],
+}
+SPELL_ELEMENTS = ["Arcane", "Fire", "Frost", "Lightning", "Radiant", "Shadow",
+                  "Thunder", "Acid", "Psychic", "Force"]
+SPELL_FORMS = ["Bolt", "Burst", "Ward", "Step", "Touch", "Nova", "Lance", "Veil"]
+
+# Records per random stream in the synthetic generators: a shard starting mid-block
+# replays at most this many records' draws to reach its first one
+GENERATOR_BLOCK = 1024
+
+def _rng(seed, stream):
+    """Independent, reproducible random stream per record type"""
+    return random.Random(f"{seed}:{stream}")
+
+def _weighted(rng, weights):
+    return rng.choices(list(weights), weights=list(weights.values()))[0]
 
-def seed_item_templates():
-    """Create 20 item templates"""
+def parse_weights(spec, choices):
+    """Parse "Wizard=3,Fighter=1" into a weight dict; empty spec means uniform over choices"""
+    if not spec:
+        return {choice: 1 for choice in choices}
+    weights = {}
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        weights[name.strip()] = float(weight) if weight else 1.0
+    return weights
+
+def parse_size(text):
+    """Parse a byte count such as "65536", "64k" or "2m" """
+    text = str(text).strip().lower()
+    units = {"k": 1024, "m": 1024 * 1024}
+    if text and text[-1] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    return int(text)
+
+def item_template_name(index):
+    """Unique, reproducible item template name for a synthetic index"""
+    adjective = ITEM_ADJECTIVES[index % len(ITEM_ADJECTIVES)]
+    return f"{adjective} Relic #{index + 1}"
+
+def spell_template_name(index):
+    """Unique, reproducible spell template name for a synthetic index"""
+    element = SPELL_ELEMENTS[index % len(SPELL_ELEMENTS)]
+    return f"{element} Weave #{index + 1}"
+
+def generate_item_templates(count, seed=0, category_weights=None):
+    """Yield `count` item templates with bonuses inside the CreateItemTemplateDto ranges"""
+    rng = _rng(seed, "itemtemplates")
+    category_weights = category_weights or {category: 1 for category in ITEM_CATEGORIES}
+    for index in range(count):
+        category = _weighted(rng, category_weights)
+        noun = rng.choice(ITEM_NOUNS.get(category, ["Trinket"]))
+        template = {
+            "name": item_template_name(index),
+            "effect": f"A {category.lower()} shaped like a {noun.lower()}.",
+            "category": category,
+            "isActive": True,
+        }
+        budget = MAX_POSITIVE_BONUS
+        if category == "Armor":
+            template["armorBonus"] = rng.randint(1, 12)
+            budget -= template["armorBonus"]
+        for stat in rng.sample(STAT_FIELDS, rng.randint(1, 3)):
+            if budget <= 0:
+                break
+            template[f"{stat}Bonus"] = min(rng.randint(1, 6), budget)
+            budget -= template[f"{stat}Bonus"]
+        yield template
+
+def generate_spell_templates(count, seed=0, school_weights=None):
+    """Yield `count` spell templates with levels inside the CreateSpellTemplateDto range"""
+    rng = _rng(seed, "spelltemplates")
+    school_weights = school_weights or {school: 1 for school in SPELL_SCHOOLS}
+    for index in range(count):
+        level = rng.randint(0, 9)
+        template = {
+            "name": spell_template_name(index),
+            "effect": f"A {rng.choice(SPELL_FORMS).lower()} of {SPELL_ELEMENTS[index % len(SPELL_ELEMENTS)].lower()} energy.",
+            "level": level,
+            "school": _weighted(rng, school_weights),
+            "castingTime": rng.choice(["1 action", "1 bonus action", "1 reaction"]),
+            "range": rng.choice(["Self", "Touch", "30 feet", "60 feet", "120 feet"]),
+            "components": rng.choice(["V", "V, S", "V, S, M", "S, M"]),
+            "duration": rng.choice(["Instantaneous", "1 minute", "Concentration, up to 1 hour"]),
+            "isActive": True,
+        }
+        if rng.random() < 0.6:
+            template["damage"] = f"{max(level, 1)}d{rng.choice([4, 6, 8, 10, 12])}"
+        yield template
+
+def _block_rngs(seed, stream, start, stop, skip):
+    """Yield (index, rng) for records start..stop-1, one random stream per GENERATOR_BLOCK records.
+
+    Any range can be generated on its own: starting mid-block, `skip(rng)` replays
+    the draws of each earlier record in the block.
+    """
+    rng = None
+    for index in range(start, stop):
+        if rng is None or index % GENERATOR_BLOCK == 0:
+            rng = _rng(seed, f"{stream}:{index // GENERATOR_BLOCK}")
+            for _ in range(index % GENERATOR_BLOCK):
+                skip(rng)
+        yield index, rng
+
+def _draw_level(rng):
+    return rng.randint(1, 20)
+
+def generate_character_levels(count, seed=0, start=0):
+    """Yield the levels of characters start..count-1 without generating the rest of them"""
+    for _, rng in _block_rngs(seed, "character-levels", start, count, _draw_level):
+        yield _draw_level(rng)
+
+def _draw_character(rng, class_weights):
+    """Draw a character's (name, class, armor class, stats)"""
+    stats = [rng.randint(6, 20) for _ in STAT_FIELDS]
+    while sum(stats) > MAX_TOTAL_STATS:
+        stats[stats.index(max(stats))] -= 1
+    name = f"{rng.choice(NAME_PREFIXES)}{rng.choice(NAME_SUFFIXES)}"
+    return name, _weighted(rng, class_weights), rng.randint(10, 22), stats
+
+def generate_characters(count, seed=0, class_weights=None, start=0):
+    """Yield characters start..count-1, whose stats satisfy [Range(1, 20)] and the 90-point total"""
+    class_weights = class_weights or {cls: 1 for cls in CHARACTER_CLASSES}
+    draws = _block_rngs(seed, "characters", start, count, lambda rng: _draw_character(rng, class_weights))
+    for (index, rng), level in zip(draws, generate_character_levels(count, seed, start)):
+        name, character_class, armor_class, stats = _draw_character(rng, class_weights)
+        character = {
+            "name": f"{name} #{index + 1}",
+            "class": character_class,
+            "level": level,
+            "armorClass": armor_class,
+        }
+        character.update(zip(STAT_FIELDS, stats))
+        yield character
+
+def generate_assignments(key, count, character_count, template_count, template_name, seed=0,
+                         character_levels=None, template_levels=None, start=0, stop=None):
+    """Yield up to `count` {"char_idx", key} assignments spread evenly over the characters
+
+    Only the assignments of characters start..stop-1 are generated, and each takes
+    exactly one draw, so the result does not depend on the range. With
+    `character_levels` (an iterator over those characters' levels, in order) and
+    `template_levels`, only templates the character can learn are drawn -
+    SpellService.CanCharacterLearnSpell - and characters that can learn none are skipped.
+    """
+    if not count or not character_count or not template_count:
+        return
+    stop = character_count if stop is None else stop
+    ranked = sorted(range(template_count), key=lambda i: template_levels[i]) if template_levels else None
+    ranked_levels = [template_levels[i] for i in ranked] if ranked else None
+    level_idx, level = start - 1, None
+    # char_idx = index * character_count // count is in [start, stop) for these indexes
+    first, last = -(-start * count // character_count), -(-stop * count // character_count)
+    for index, rng in _block_rngs(seed, f"{key}-assignments", first, last, lambda rng: rng.random()):
+        char_idx = index * character_count // count
+        draw = rng.random()
+        if ranked is None:
+            template_idx = int(draw * template_count)
+        else:
+            while level_idx < char_idx:
+                level, level_idx = next(character_levels), level_idx + 1
+            learnable = bisect.bisect_right(ranked_levels, (level + 1) // 2)
+            if not learnable:
+                continue
+            template_idx = ranked[int(draw * learnable)]
+        yield {"char_idx": char_idx, key: template_name(template_idx)}
+
+def profile_character_count(profile, characters=20):
+    """Number of characters a profile seeds"""
+    return len(FIXTURE_CHARACTERS) if profile == "fixture" else characters
+
+def build_dataset(profile="fixture", seed=0, item_templates=20, spell_templates=20,
+                  characters=20, items=20, spells=20, class_weights=None,
+                  school_weights=None, category_weights=None, character_range=None):
+    """Return the record streams for a seeding profile.
+
+    `character_range` (start, stop) limits the characters, and the item and spell
+    assignments (still indexed from the first character), to that slice; the
+    templates are always complete.
+    """
+    start, stop = character_range or (0, profile_character_count(profile, characters))
+    if profile == "fixture":
+        return {
+            "item_templates": FIXTURE_ITEM_TEMPLATES,
+            "spell_templates": FIXTURE_SPELL_TEMPLATES,
+            "characters": FIXTURE_CHARACTERS[start:stop],
+            "item_assignments": [a for a in FIXTURE_ITEM_ASSIGNMENTS if start <= a["char_idx"] < stop],
+            "spell_assignments": [a for a in FIXTURE_SPELL_ASSIGNMENTS if start <= a["char_idx"] < stop],
+        }
+    if profile != "synthetic":
+        raise ValueError(f"Unknown profile: {profile}")
+    return {
+        "item_templates": generate_item_templates(item_templates, seed, category_weights),
+        "spell_templates": generate_spell_templates(spell_templates, seed, school_weights),
+        "characters": generate_characters(stop, seed, class_weights, start),
+        "item_assignments": generate_assignments("item", items, characters, item_templates,
+                                                 item_template_name, seed, start=start, stop=stop),
+        "spell_assignments": generate_assignments(
+            "spell", spells, characters, spell_templates, spell_template_name, seed,
+            character_levels=generate_character_levels(stop, seed, start),
+            template_levels=[t["level"] for t in generate_spell_templates(spell_templates, seed,
+                                                                          school_weights)],
+            start=start, stop=stop),
+    }
+
+# ---------------------------------------------------------------------------
+# Seeding
+# ---------------------------------------------------------------------------
+
+def seed_item_templates(item_templates=FIXTURE_ITEM_TEMPLATES, journal=None):
+    """Create item templates (20 fixture templates by default)"""
     print("Creating item templates...")
     
-    item_templates = [
-        # Weapons
-        {"name": "Excalibur", "effect": "The legendary sword of King Arthur.", "strengthBonus": 5, "charismaBonus": 3, "category": "Weapon", "isActive": True},
-        {"name": "Mjolnir", "effect": "Thor's mighty hammer.", "strengthBonus": 6, "constitutionBonus": 3, "category": "Weapon", "isActive": True},
-        {"name": "Gungnir", "effect": "Odin's spear that never misses.", "dexterityBonus": 4, "wisdomBonus": 3, "category": "Weapon", "isActive": True},
-        {"name": "Dragonslayer Sword", "effect": "Forged to slay dragons.", "strengthBonus": 4, "category": "Weapon", "isActive": True},
-        {"name": "Elven Longbow", "effect": "Masterfully crafted elven bow.", "dexterityBonus": 4, "category": "Weapon", "isActive": True},
-        {"name": "Staff of Elements", "effect": "Controls elemental forces.", "intelligenceBonus": 4, "wisdomBonus": 2, "category": "Weapon", "isActive": True},
-        {"name": "Shadow Daggers", "effect": "Twin daggers of shadow.", "dexterityBonus": 5, "category": "Weapon", "isActive": True},
-        
-        # Armor
-        {"name": "Dragon Scale Mail", "effect": "Armor from dragon scales.", "armorBonus": 10, "constitutionBonus": 3, "category": "Armor", "isActive": True},
-        {"name": "Celestial Plate", "effect": "Blessed by celestial beings.", "armorBonus": 9, "wisdomBonus": 2, "charismaBonus": 2, "category": "Armor", "isActive": True},
-        {"name": "Shadowsilk Robes", "effect": "Woven from shadow and moonlight.", "armorBonus": 2, "dexterityBonus": 3, "category": "Armor", "isActive": True},
-        {"name": "Adamantine Plate", "effect": "Nearly indestructible armor.", "armorBonus": 11, "category": "Armor", "isActive": True},
-        {"name": "Archmage Vestments", "effect": "Ultimate magical robes.", "armorBonus": 3, "intelligenceBonus": 5, "wisdomBonus": 2, "category": "Armor", "isActive": True},
-        {"name": "Leather of Agility", "effect": "Enhances movement and flexibility.", "armorBonus": 4, "dexterityBonus": 3, "category": "Armor", "isActive": True},
-        
-        # Accessories
-        {"name": "Ring of Power", "effect": "One ring to rule them all.", "strengthBonus": 2, "dexterityBonus": 2, "constitutionBonus": 2, "intelligenceBonus": 2, "wisdomBonus": 2, "charismaBonus": 2, "category": "Accessory", "isActive": True},
-        {"name": "Amulet of Life", "effect": "Protects against death magic.", "constitutionBonus": 4, "wisdomBonus": 2, "category": "Accessory", "isActive": True},
-        {"name": "Boots of Speed", "effect": "Greatly increases movement speed.", "dexterityBonus": 4, "category": "Accessory", "isActive": True},
-        {"name": "Gauntlets of Strength", "effect": "Grants incredible physical power.", "strengthBonus": 6, "category": "Accessory", "isActive": True},
-        {"name": "Cloak of Protection", "effect": "Provides magical protection.", "armorBonus": 3, "constitutionBonus": 2, "category": "Accessory", "isActive": True},
-        {"name": "Crown of Wisdom", "effect": "Enhances mental faculties.", "intelligenceBonus": 4, "wisdomBonus": 4, "category": "Accessory", "isActive": True},
-        {"name": "Belt of Giant Strength", "effect": "Grants the strength of giants.", "strengthBonus": 5, "constitutionBonus": 2, "category": "Accessory", "isActive": True}
-    ]
-    
     created_templates = []
-    for template in item_templates:
-        result = make_request("POST", "itemtemplates", template)
+    for template, result in create_records("itemtemplates", item_templates, journal):
         if result:
             created_templates.append(result)
-            print(f"✓ Created item template: {template['name']}")
+            log_record(f"✓ Created item template: {template['name']}")
         else:
-            print(f"✗ Failed to create item template: {template['name']}")
-        time.sleep(0.3)
+            log_record(f"✗ Failed to create item template: {template['name']}")
     
     return created_templates
 
-def seed_spell_templates():
-    """Create 20 spell templates"""
+def seed_spell_templates(spell_templates=FIXTURE_SPELL_TEMPLATES, journal=None):
+    """Create spell templates (20 fixture templates by default)"""
     print("\nCreating spell templates...")
     
-    spell_templates = [
-        # Cantrips
-        {"name": "Fire Bolt", "effect": "A mote of fire streaks toward target.", "damage": "1d10", "level": 0, "school": "Evocation", "castingTime": "1 action", "range": "120 feet", "components": "V, S", "duration": "Instantaneous", "isActive": True},
-        {"name": "Mage Hand", "effect": "A spectral hand appears.", "level": 0, "school": "Conjuration", "castingTime": "1 action", "range": "30 feet", "components": "V, S", "duration": "1 minute", "isActive": True},
-        {"name": "Minor Illusion", "effect": "Create a sound or image.", "level": 0, "school": "Illusion", "castingTime": "1 action", "range": "30 feet", "components": "S, M", "duration": "1 minute", "isActive": True},
-        {"name": "Eldritch Blast", "effect": "A crackling beam of energy.", "damage": "1d10", "level": 0, "school": "Evocation", "castingTime": "1 action", "range": "120 feet", "components": "V, S", "duration": "Instantaneous", "isActive": True},
-        {"name": "Sacred Flame", "effect": "Radiance descends on target.", "damage": "1d8", "level": 0, "school": "Evocation", "castingTime": "1 action", "range": "60 feet", "components": "V, S", "duration": "Instantaneous", "isActive": True},
-        
-        # Level 1-3
-        {"name": "Magic Missile", "effect": "Three darts of magical force.", "damage": "1d4+1", "level": 1, "school": "Evocation", "castingTime": "1 action", "range": "120 feet", "components": "V, S", "duration": "Instantaneous", "isActive": True},
-        {"name": "Healing Word", "effect": "Heal a creature with a word.", "damage": "1d4+mod", "level": 1, "school": "Evocation", "castingTime": "1 bonus action", "range": "60 feet", "components": "V", "duration": "Instantaneous", "isActive": True},
-        {"name": "Shield", "effect": "Invisible barrier protects you.", "level": 1, "school": "Abjuration", "castingTime": "1 reaction", "range": "Self", "components": "V, S", "duration": "1 round", "isActive": True},
-        {"name": "Burning Hands", "effect": "Flames shoot from fingertips.", "damage": "3d6", "level": 1, "school": "Evocation", "castingTime": "1 action", "range": "Self (15-foot cone)", "components": "V, S", "duration": "Instantaneous", "isActive": True},
-        {"name": "Cure Wounds", "effect": "Touch heals hit points.", "damage": "1d8+mod", "level": 1, "school": "Evocation", "castingTime": "1 action", "range": "Touch", "components": "V, S", "duration": "Instantaneous", "isActive": True},
-        {"name": "Invisibility", "effect": "Become invisible.", "level": 2, "school": "Illusion", "castingTime": "1 action", "range": "Touch", "components": "V, S, M", "duration": "Concentration, up to 1 hour", "isActive": True},
-        {"name": "Misty Step", "effect": "Teleport up to 30 feet.", "level": 2, "school": "Conjuration", "castingTime": "1 bonus action", "range": "Self", "components": "V", "duration": "Instantaneous", "isActive": True},
-        {"name": "Fireball", "effect": "Explosion of flame.", "damage": "8d6", "level": 3, "school": "Evocation", "castingTime": "1 action", "range": "150 feet", "components": "V, S, M", "duration": "Instantaneous", "isActive": True},
-        {"name": "Lightning Bolt", "effect": "Line of lightning.", "damage": "8d6", "level": 3, "school": "Evocation", "castingTime": "1 action", "range": "Self (100-foot line)", "components": "V, S, M", "duration": "Instantaneous", "isActive": True},
-        {"name": "Counterspell", "effect": "Interrupt spellcasting.", "level": 3, "school": "Abjuration", "castingTime": "1 reaction", "range": "60 feet", "components": "S", "duration": "Instantaneous", "isActive": True},
-        
-        # High Level
-        {"name": "Dimension Door", "effect": "Teleport anywhere in range.", "level": 4, "school": "Conjuration", "castingTime": "1 action", "range": "500 feet", "components": "V", "duration": "Instantaneous", "isActive": True},
-        {"name": "Polymorph", "effect": "Transform into a beast.", "level": 4, "school": "Transmutation", "castingTime": "1 action", "range": "60 feet", "components": "V, S, M", "duration": "Concentration, up to 1 hour", "isActive": True},
-        {"name": "Telekinesis", "effect": "Move objects with your mind.", "level": 5, "school": "Transmutation", "castingTime": "1 action", "range": "60 feet", "components": "V, S", "duration": "Concentration, up to 10 minutes", "isActive": True},
-        {"name": "Chain Lightning", "effect": "Lightning arcs between targets.", "damage": "10d8", "level": 6, "school": "Evocation", "castingTime": "1 action", "range": "150 feet", "components": "V, S, M", "duration": "Instantaneous", "isActive": True},
-        {"name": "Time Stop", "effect": "Stop time briefly.", "level": 9, "school": "Transmutation", "castingTime": "1 action", "range": "Self", "components": "V", "duration": "Instantaneous", "isActive": True}
-    ]
-    
     created_templates = []
-    for template in spell_templates:
-        result = make_request("POST", "spelltemplates", template)
+    for template, result in create_records("spelltemplates", spell_templates, journal):
         if result:
             created_templates.append(result)
-            print(f"✓ Created spell template: {template['name']}")
+            log_record(f"✓ Created spell template: {template['name']}")
         else:
-            print(f"✗ Failed to create spell template: {template['name']}")
-        time.sleep(0.3)
+            log_record(f"✗ Failed to create spell template: {template['name']}")
     
     return created_templates
 
-def seed_characters():
-    """Create 20 characters"""
+def seed_characters(characters=FIXTURE_CHARACTERS, journal=None):
+    """Create characters (20 fixture characters by default).
+
+    Returns one entry per character, None where creation failed, so the assignments'
+    char_idx still points at the right character.
+    """
     print("\nCreating characters...")
     
-    characters = [
-        {"name": "Gandalf the Grey", "class": "Wizard", "level": 15, "armorClass": 12, "strength": 10, "dexterity": 11, "constitution": 12, "intelligence": 20, "wisdom": 18, "charisma": 16},
-        {"name": "Aragorn", "class": "Ranger", "level": 12, "armorClass": 18, "strength": 16, "dexterity": 18, "constitution": 15, "intelligence": 14, "wisdom": 16, "charisma": 14},
-        {"name": "Legolas", "class": "Ranger", "level": 10, "armorClass": 16, "strength": 12, "dexterity": 20, "constitution": 14, "intelligence": 13, "wisdom": 18, "charisma": 15},
-        {"name": "Gimli", "class": "Fighter", "level": 11, "armorClass": 20, "strength": 18, "dexterity": 10, "constitution": 18, "intelligence": 10, "wisdom": 12, "charisma": 11},
-        {"name": "Merlin", "class": "Wizard", "level": 20, "armorClass": 14, "strength": 8, "dexterity": 12, "constitution": 14, "intelligence": 20, "wisdom": 19, "charisma": 17},
-        {"name": "Robin Hood", "class": "Rogue", "level": 8, "armorClass": 15, "strength": 12, "dexterity": 20, "constitution": 13, "intelligence": 14, "wisdom": 16, "charisma": 15},
-        {"name": "Conan", "class": "Barbarian", "level": 9, "armorClass": 16, "strength": 20, "dexterity": 16, "constitution": 18, "intelligence": 10, "wisdom": 11, "charisma": 12},
-        {"name": "Elara Moonwhisper", "class": "Cleric", "level": 7, "armorClass": 17, "strength": 13, "dexterity": 11, "constitution": 15, "intelligence": 14, "wisdom": 20, "charisma": 16},
-        {"name": "Zara Nightblade", "class": "Rogue", "level": 13, "armorClass": 17, "strength": 10, "dexterity": 20, "constitution": 14, "intelligence": 16, "wisdom": 15, "charisma": 12},
-        {"name": "Thorin Ironforge", "class": "Fighter", "level": 14, "armorClass": 19, "strength": 18, "dexterity": 12, "constitution": 17, "intelligence": 11, "wisdom": 13, "charisma": 10},
-        {"name": "Luna Starweaver", "class": "Sorcerer", "level": 11, "armorClass": 13, "strength": 8, "dexterity": 16, "constitution": 13, "intelligence": 15, "wisdom": 12, "charisma": 20},
-        {"name": "Finn the Bold", "class": "Bard", "level": 9, "armorClass": 14, "strength": 10, "dexterity": 16, "constitution": 12, "intelligence": 14, "wisdom": 13, "charisma": 18},
-        {"name": "Brother Marcus", "class": "Monk", "level": 10, "armorClass": 16, "strength": 12, "dexterity": 18, "constitution": 15, "intelligence": 13, "wisdom": 20, "charisma": 11},
-        {"name": "Draven Shadowmere", "class": "Warlock", "level": 12, "armorClass": 15, "strength": 10, "dexterity": 14, "constitution": 16, "intelligence": 15, "wisdom": 12, "charisma": 20},
-        {"name": "Gaia Earthsong", "class": "Druid", "level": 13, "armorClass": 14, "strength": 12, "dexterity": 15, "constitution": 16, "intelligence": 13, "wisdom": 20, "charisma": 14},
-        {"name": "Sir Galahad", "class": "Paladin", "level": 16, "armorClass": 20, "strength": 18, "dexterity": 10, "constitution": 16, "intelligence": 12, "wisdom": 15, "charisma": 18},
-        {"name": "Tempest Stormborn", "class": "Sorcerer", "level": 14, "armorClass": 15, "strength": 9, "dexterity": 17, "constitution": 15, "intelligence": 16, "wisdom": 13, "charisma": 20},
-        {"name": "Kael Swiftstrike", "class": "Ranger", "level": 11, "armorClass": 16, "strength": 14, "dexterity": 20, "constitution": 15, "intelligence": 12, "wisdom": 17, "charisma": 13},
-        {"name": "Morgana Le Fay", "class": "Wizard", "level": 18, "armorClass": 16, "strength": 8, "dexterity": 14, "constitution": 13, "intelligence": 20, "wisdom": 16, "charisma": 17},
-        {"name": "Bjorn Bloodaxe", "class": "Barbarian", "level": 12, "armorClass": 15, "strength": 20, "dexterity": 14, "constitution": 19, "intelligence": 8, "wisdom": 10, "charisma": 11}
-    ]
-    
     created_characters = []
-    for character in characters:
-        result = make_request("POST", "characters", character)
+    for character, result in create_records("characters", characters, journal):
         if result:
-            created_characters.append(result)
-            print(f"✓ Created character: {character['name']} (Level {character['level']} {character['class']})")
+            # The response echoes ImageBase64; keeping it would hold every portrait in memory
+            result.pop("imageBase64", None)
+            log_record(f"✓ Created character: {character['name']} (Level {character['level']} {character['class']})")
         else:
-            print(f"✗ Failed to create character: {character['name']}")
-        time.sleep(0.3)
+            result = None
+            log_record(f"✗ Failed to create character: {character['name']}")
+        created_characters.append(result)
     
     return created_characters
 
-def seed_items(characters, item_templates):
-    """Create 20 items for characters"""
+def seed_items(characters, item_templates, assignments=FIXTURE_ITEM_ASSIGNMENTS, journal=None):
+    """Create items for characters (20 fixture assignments by default)"""
     print("\nCreating items...")
     
-    if not characters or not item_templates:
+    if not any(characters) or not item_templates:
         print("No characters or item templates available")
         return []
     
     created_items = []
     template_lookup = {t['name']: t['id'] for t in item_templates}
     
-    # Assign specific items to first 10 characters
-    assignments = [
-        {"char_idx": 0, "item": "Staff of Elements"},      # Gandalf
-        {"char_idx": 1, "item": "Elven Longbow"},          # Aragorn  
-        {"char_idx": 2, "item": "Elven Longbow"},          # Legolas
-        {"char_idx": 3, "item": "Mjolnir"},                # Gimli
-        {"char_idx": 4, "item": "Archmage Vestments"},     # Merlin
-        {"char_idx": 5, "item": "Shadow Daggers"},         # Robin Hood
-        {"char_idx": 6, "item": "Dragonslayer Sword"},     # Conan
-        {"char_idx": 7, "item": "Celestial Plate"},        # Elara
-        {"char_idx": 8, "item": "Shadowsilk Robes"},       # Zara
-        {"char_idx": 9, "item": "Adamantine Plate"},       # Thorin
-        {"char_idx": 10, "item": "Ring of Power"},         # Luna
-        {"char_idx": 11, "item": "Crown of Wisdom"},       # Finn
-        {"char_idx": 12, "item": "Gauntlets of Strength"}, # Marcus
-        {"char_idx": 13, "item": "Cloak of Protection"},   # Draven
-        {"char_idx": 14, "item": "Amulet of Life"},        # Gaia
-        {"char_idx": 15, "item": "Excalibur"},             # Galahad
-        {"char_idx": 16, "item": "Belt of Giant Strength"}, # Tempest
-        {"char_idx": 17, "item": "Boots of Speed"},        # Kael
-        {"char_idx": 18, "item": "Dragon Scale Mail"},     # Morgana
-        {"char_idx": 19, "item": "Gungnir"}                # Bjorn
-    ]
-    
-    for assignment in assignments:
-        char_idx = assignment["char_idx"]
-        item_name = assignment["item"]
-        
-        if char_idx < len(characters) and item_name in template_lookup:
-            item_request = {
-                "itemTemplateId": template_lookup[item_name],
-                "characterId": characters[char_idx]['id']
-            }
+    def item_requests():
+        for assignment in assignments:
+            char_idx = assignment["char_idx"]
+            item_name = assignment["item"]
+            character = characters[char_idx] if char_idx < len(characters) else None
             
-            result = make_request("POST", "items/from-template", item_request)
-            if result:
-                created_items.append(result)
-                print(f"✓ Created item: {item_name} for {characters[char_idx]['name']}")
-            else:
-                print(f"✗ Failed to create item: {item_name}")
-            time.sleep(0.3)
+            # A character that failed to be created takes its items and spells with it
+            if character is not None and item_name in template_lookup:
+                yield {
+                    "itemTemplateId": template_lookup[item_name],
+                    "characterId": character['id']
+                }
+    
+    names = {t['id']: t['name'] for t in item_templates}
+    owners = {c['id']: c['name'] for c in characters if c is not None}
+    for item_request, result in create_records("items/from-template", item_requests(), journal,
+                                                 occurrence_key("characterId", "itemTemplateId")):
+        item_name = names[item_request["itemTemplateId"]]
+        if result:
+            created_items.append(result)
+            log_record(f"✓ Created item: {item_name} for {owners[item_request['characterId']]}")
+        else:
+            log_record(f"✗ Failed to create item: {item_name}")
     
     return created_items
 
-def seed_spells(characters, spell_templates):
-    """Create 20 spells for characters"""
+def seed_spells(characters, spell_templates, spell_assignments=FIXTURE_SPELL_ASSIGNMENTS, journal=None):
+    """Create spells for characters (20 fixture assignments by default)"""
     print("\nCreating spells...")
     
-    if not characters or not spell_templates:
+    if not any(characters) or not spell_templates:
         print("No characters or spell templates available")
         return []
     
     created_spells = []
     template_lookup = {t['name']: t['id'] for t in spell_templates}
     
-    # Assign spells to spellcasting characters
-    spell_assignments = [
-        {"char_idx": 0, "spell": "Fireball"},         # Gandalf
-        {"char_idx": 0, "spell": "Lightning Bolt"},   # Gandalf
-        {"char_idx": 4, "spell": "Time Stop"},        # Merlin
-        {"char_idx": 4, "spell": "Chain Lightning"},  # Merlin
-        {"char_idx": 7, "spell": "Healing Word"},     # Elara
-        {"char_idx": 7, "spell": "Cure Wounds"},      # Elara
-        {"char_idx": 10, "spell": "Magic Missile"},   # Luna
-        {"char_idx": 10, "spell": "Invisibility"},    # Luna
-        {"char_idx": 11, "spell": "Minor Illusion"},  # Finn
-        {"char_idx": 11, "spell": "Misty Step"},      # Finn
-        {"char_idx": 13, "spell": "Eldritch Blast"},  # Draven
-        {"char_idx": 13, "spell": "Counterspell"},    # Draven
-        {"char_idx": 14, "spell": "Cure Wounds"},     # Gaia
-        {"char_idx": 14, "spell": "Polymorph"},       # Gaia
-        {"char_idx": 15, "spell": "Sacred Flame"},    # Galahad
-        {"char_idx": 15, "spell": "Shield"},          # Galahad
-        {"char_idx": 16, "spell": "Fire Bolt"},       # Tempest
-        {"char_idx": 16, "spell": "Dimension Door"},  # Tempest
-        {"char_idx": 18, "spell": "Telekinesis"},     # Morgana
-        {"char_idx": 18, "spell": "Burning Hands"}    # Morgana
-    ]
-    
-    for assignment in spell_assignments:
-        char_idx = assignment["char_idx"]
-        spell_name = assignment["spell"]
-        
-        if char_idx < len(characters) and spell_name in template_lookup:
-            spell_request = {
-                "spellTemplateId": template_lookup[spell_name],
-                "characterId": characters[char_idx]['id']
-            }
+    def spell_requests():
+        for assignment in spell_assignments:
+            char_idx = assignment["char_idx"]
+            spell_name = assignment["spell"]
+            character = characters[char_idx] if char_idx < len(characters) else None
             
-            result = make_request("POST", "spells/from-template", spell_request)
-            if result:
-                created_spells.append(result)
-                print(f"✓ Created spell: {spell_name} for {characters[char_idx]['name']}")
-            else:
-                print(f"✗ Failed to create spell: {spell_name}")
-            time.sleep(0.3)
+            # A character that failed to be created takes its items and spells with it
+            if character is not None and spell_name in template_lookup:
+                yield {
+                    "spellTemplateId": template_lookup[spell_name],
+                    "characterId": character['id']
+                }
+    
+    names = {t['id']: t['name'] for t in spell_templates}
+    owners = {c['id']: c['name'] for c in characters if c is not None}
+    for spell_request, result in create_records("spells/from-template", spell_requests(), journal,
+                                                  occurrence_key("characterId", "spellTemplateId")):
+        spell_name = names[spell_request["spellTemplateId"]]
+        if result:
+            created_spells.append(result)
+            log_record(f"✓ Created spell: {spell_name} for {owners[spell_request['characterId']]}")
+        else:
+            log_record(f"✗ Failed to create spell: {spell_name}")
     
     return created_spells
 
-def main():
-    """Main seeding function - exactly 100 entries"""
-    print("🚀 Starting Database Seeding - 100 Entries Total")
-    print(f"Target URL: {BASE_URL}")
+# ---------------------------------------------------------------------------
+# Sharding
+# ---------------------------------------------------------------------------
+
+def parse_shards(spec, shard_count):
+    """Parse "0-3,6" into sorted shard indexes below `shard_count`; None selects every shard"""
+    if spec is None:
+        return list(range(shard_count))
+    shards = set()
+    for part in filter(None, spec.replace(" ", "").split(",")):
+        first, _, last = part.partition("-")
+        shards.update(range(int(first), int(last or first) + 1))
+    if not shards or min(shards) < 0 or max(shards) >= shard_count:
+        raise ValueError(f"shard indexes must be between 0 and {shard_count - 1}: {spec!r}")
+    return sorted(shards)
+
+def shard_path(path, shard, shard_count):
+    """Per-shard variant of a journal or trace file name: seed.jsonl -> seed-shard-2-of-4.jsonl"""
+    root, ext = os.path.splitext(path)
+    return f"{root}-shard-{shard}-of-{shard_count}{ext}"
+
+def shard_range(shard, shard_count, total):
+    """Positions [start, stop) of the records in one shard: contiguous blocks, sizes differing by at most one"""
+    return shard * total // shard_count, (shard + 1) * total // shard_count
+
+def shard_dataset(args, shard):
+    """Build one shard's characters and the items and spells assigned to them.
+
+    Assignments are spread evenly over the characters, so contiguous blocks of
+    characters also balance the items and spells. Only the shard's own range is
+    generated, and its assignment indexes are renumbered to the shard's own
+    character list; templates are shared and left to the caller.
+    """
+    start, stop = shard_range(shard, args.shard_count, profile_character_count(args.profile, args.characters))
+    dataset = dataset_from_args(args, (start, stop))
+    
+    def assignments(stream):
+        for assignment in stream:
+            yield dict(assignment, char_idx=assignment["char_idx"] - start)
+    
+    return dict(dataset,
+                item_assignments=assignments(dataset["item_assignments"]),
+                spell_assignments=assignments(dataset["spell_assignments"]))
+
+def lookup_templates(endpoint, templates):
+    """Find the already created records of a dataset's templates, by name, through the response cache"""
+    names = {template["name"] for template in templates}
+    found = [{"name": name, "id": template_id}
+             for name, template_id in fetch_template_lookup(endpoint).items() if name in names]
+    if len(found) < len(names):
+        print(f"⚠️  Only {len(found)} of {len(names)} {endpoint} exist - run with --templates-only first")
+    else:
+        print(f"✓ Found {len(found)} {endpoint}")
+    return found
+
+def seed_shard(args, shard, item_templates, spell_templates):
+    """Seed one shard's characters, items and spells; runs in a worker process.
+
+    Returns the shard's ID maps together with its request, retry, cache, latency and
+    throughput counters, for merge_shard_result to fold into the parent's.
+    """
+    start = time.perf_counter()
+    _throughput.clear()    # a pool process may seed several shards
+    instrumentation = configure_instrumentation(
+        trace_path=shard_path(args.trace, shard, args.shard_count) if args.trace else None, quiet=args.quiet)
+    configure_from_args(args)
+    dataset = shard_dataset(args, shard)
+    journal = None
+    if args.journal:
+        journal = SeedJournal(shard_path(args.journal, shard, args.shard_count), args.journal_batch,
+                              resume=args.resume)
+    try:
+        characters = seed_characters(dataset["characters"], journal)
+        items = seed_items(characters, item_templates, dataset["item_assignments"], journal)
+        spells = seed_spells(characters, spell_templates, dataset["spell_assignments"], journal)
+    finally:
+        if journal is not None:
+            journal.close()
+        instrumentation.close()
+    histogram = instrumentation.find(HistogramSink)
+    return {
+        "shard": shard,
+        "characters": [character["id"] if character is not None else None for character in characters],
+        "items": [item["id"] for item in items],
+        "spells": [spell["id"] for spell in spells],
+        "resumed": journal.resumed if journal is not None else 0,
+        "client": get_client().stats.snapshot(),
+        "retries": get_retry_policy().metrics,
+        "cache": get_cache().stats,
+        "requests": histogram.endpoints if histogram is not None else {},
+        "throughput": list(_throughput),
+        "elapsed": time.perf_counter() - start,
+    }
+
+def count_created(records):
+    """Count the records of a seed_characters-style result that were created (not None)"""
+    return sum(record is not None for record in records)
+
+def merge_counts(target, counts):
+    """Add the numbers in `counts` to `target`, recursing into nested dicts"""
+    for key, value in counts.items():
+        if isinstance(value, dict):
+            merge_counts(target.setdefault(key, {}), value)
+        else:
+            target[key] = target.get(key, 0) + value
+
+def merge_shard_result(result):
+    """Fold a shard's counters into this process's client, retry, cache and latency stats"""
+    get_client().stats.merge(result["client"])
+    merge_counts(get_retry_policy().metrics, result["retries"])
+    merge_counts(get_cache().stats, result["cache"])
+    histogram = get_instrumentation().find(HistogramSink)
+    if histogram is not None:
+        histogram.merge(result["requests"])
+
+def merge_throughput(results):
+    """Add one throughput row per endpoint for all shards: records summed over the slowest shard's time"""
+    rows = {}
+    for result in results:
+        for endpoint, mode, created, count, elapsed in result["throughput"]:
+            row = rows.setdefault((endpoint, mode), [0, 0, 0.0])
+            row[0] += created
+            row[1] += count
+            row[2] = max(row[2], elapsed)
+    _throughput.extend((endpoint, mode, *row) for (endpoint, mode), row in rows.items())
+
+def seed_shards(args, shards, item_templates, spell_templates):
+    """Seed `shards` in a process pool and merge their results.
+
+    Returns (character IDs in dataset order with None for failures, item IDs, spell IDs,
+    records resumed from journals, indexes of the shards that raised).
+    The rate limit is split evenly between the processes.
+    """
+    processes = min(args.processes or os.cpu_count() or 1, len(shards))
+    shard_args = copy.copy(args)
+    if args.rate_limit:
+        shard_args.rate_limit = args.rate_limit / processes
+    print(f"\nSeeding shard{'s' if len(shards) > 1 else ''} {', '.join(map(str, shards))} "
+          f"of {args.shard_count} in {processes} process{'es' if processes > 1 else ''}...")
+    
+    characters, items, spells = [], [], []
+    resumed = 0
+    results, failed = [], []
+    # "spawn" so workers never inherit the parent's client threads, sockets or locks
+    with ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context("spawn")) as pool:
+        futures = {pool.submit(seed_shard, shard_args, shard, item_templates, spell_templates): shard
+                   for shard in shards}
+        for future in as_completed(futures):
+            shard = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"❌ Shard {shard}/{args.shard_count} failed: {e}")
+                failed.append(shard)
+                continue
+            results.append(result)
+            items.extend(result["items"])
+            spells.extend(result["spells"])
+            resumed += result["resumed"]
+            merge_shard_result(result)
+            print(f"✓ Shard {shard}/{args.shard_count}: {count_created(result['characters'])} characters, "
+                  f"{len(result['items'])} items, {len(result['spells'])} spells in {result['elapsed']:.2f}s")
+    merge_throughput(results)
+    for result in sorted(results, key=lambda result: result["shard"]):
+        characters.extend(result["characters"])
+    return characters, items, spells, resumed, sorted(failed)
+
+# ---------------------------------------------------------------------------
+# Portrait cost report
+# ---------------------------------------------------------------------------
+
+def _probe_character(index, portrait):
+    character = {"name": f"Portrait probe #{index + 1}", "class": "Wizard", "level": 1, "armorClass": 10}
+    character.update({stat: 10 for stat in STAT_FIELDS})
+    character["imageBase64"] = portrait
+    return character
+
+def _measure(func, trace):
+    """Run func() and return (result, latency ms, peak traced KiB or None, KiB sent, KiB received)"""
+    stats = get_client().stats
+    before = stats.snapshot()
+    if trace:
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+    started = time.perf_counter()
+    result = func()
+    latency = (time.perf_counter() - started) * 1000
+    peak = (tracemalloc.get_traced_memory()[1] - baseline) / 1024 if trace else None
+    after = stats.snapshot()
+    return (result, latency, peak, (after["bytes_sent"] - before["bytes_sent"]) / 1024,
+            (after["bytes_received"] - before["bytes_received"]) / 1024)
+
+def measure_portrait_cost(portrait, samples=PORTRAIT_SAMPLES):
+    """Create, fetch and delete probe characters with and without `portrait`, one at a time.
+
+    Latencies come from `samples` untraced runs per variant. Peak memory comes from
+    one more run under tracemalloc, which sees Python allocations only - the ones
+    a streamed upload avoids and a parsed detail response cannot.
+    """
+    report = {}
+    for variant, image in [("without", None), ("with", portrait)]:
+        for path in ("create", "detail"):
+            report[(path, variant)] = {"latencies": [], "sent": 0.0, "received": 0.0, "peak": None}
+        for index in range(samples + 1):
+            trace = index == samples
+            if trace:
+                tracemalloc.start()
+            try:
+                payload = _probe_character(index, image)
+                created, *create = _measure(lambda: make_request("POST", "characters", payload), trace)
+                if not created:
+                    continue
+                detail = _measure(lambda: make_request("GET", f"characters/{created['id']}"), trace)[1:]
+            finally:
+                if trace:
+                    tracemalloc.stop()
+            make_request("DELETE", f"characters/{created['id']}")
+            for path, (latency, peak, sent, received) in [("create", create), ("detail", detail)]:
+                row = report[(path, variant)]
+                if trace:
+                    row["peak"] = peak
+                    continue
+                row["latencies"].append(latency)
+                row["sent"] += sent
+                row["received"] += received
+    return report
+
+def print_portrait_cost(report, portrait):
+    """Print latency, transfer and memory per request path for characters with and without a portrait"""
+    print(f"Portrait cost: {portrait.size / 1024:.1f} KiB image, {len(portrait) / 1024:.1f} KiB as base64")
+    print(f"{'Path':<8} {'portrait':<9} {'count':>6} {'p50 ms':>9} {'mean ms':>9} "
+          f"{'sent KiB':>10} {'recv KiB':>10} {'peak KiB':>10}")
+    for (path, variant), row in report.items():
+        count = len(row["latencies"])
+        if not count:
+            print(f"{path:<8} {variant:<9} {0:>6}   (every probe request failed)")
+            continue
+        latencies = sorted(row["latencies"])
+        peak = f"{row['peak']:>10.1f}" if row["peak"] is not None else f"{'-':>10}"
+        print(f"{path:<8} {variant:<9} {count:>6} {percentile(latencies, 50):>9.1f} "
+              f"{sum(latencies) / count:>9.1f} {row['sent'] / count:>10.1f} {row['received'] / count:>10.1f} {peak}")
+
+# ---------------------------------------------------------------------------
+# Benchmark
+# ---------------------------------------------------------------------------
+
+# Default operation mix replayed by the benchmark command (relative weights)
+BENCHMARK_MIX = {
+    "characters": 10,          # GET characters
+    "character_detail": 40,    # GET characters/{id} - items and spells included
+    "by_class": 15,            # GET characters/by-class/{className}
+    "by_level": 15,            # GET characters/by-level?minLevel=&maxLevel=
+    "by_school": 10,           # GET spelltemplates/by-school/{school}
+    "create_item": 10,         # POST items/from-template
+}
+
+def benchmark_operation(name, rng, context):
+    """Build (label, method, endpoint, data) for one benchmark operation"""
+    if name == "characters":
+        return "GET characters", "GET", "characters", None
+    if name == "character_detail":
+        return "GET characters/{id}", "GET", f"characters/{rng.choice(context['character_ids'])}", None
+    if name == "by_class":
+        return ("GET characters/by-class/{className}", "GET",
+                f"characters/by-class/{rng.choice(CHARACTER_CLASSES)}", None)
+    if name == "by_level":
+        low = rng.randint(1, 20)
+        high = rng.randint(low, 20)
+        return ("GET characters/by-level", "GET",
+                f"characters/by-level?minLevel={low}&maxLevel={high}", None)
+    if name == "by_school":
+        return ("GET spelltemplates/by-school/{school}", "GET",
+                f"spelltemplates/by-school/{rng.choice(context['schools'])}", None)
+    if name == "create_item":
+        return "POST items/from-template", "POST", "items/from-template", {
+            "itemTemplateId": rng.choice(context["item_template_ids"]),
+            "characterId": rng.choice(context["character_ids"]),
+        }
+    raise ValueError(f"Unknown benchmark operation: {name}")
+
+def plan_benchmark(count, mix, seed, context):
+    """Yield a reproducible sequence of `count` operations drawn from the mix"""
+    rng = random.Random(f"{seed}:benchmark")
+    names = [name for name, weight in mix.items() if weight > 0]
+    weights = [mix[name] for name in names]
+    for _ in range(count):
+        yield benchmark_operation(rng.choices(names, weights=weights)[0], rng, context)
+
+def fetch_template_lookup(endpoint):
+    """Map template names to IDs for "itemtemplates" or "spelltemplates", served from the cache when fresh"""
+    return {t['name']: t['id'] for t in make_request("GET", endpoint) or []}
+
+def load_benchmark_context():
+    """Fetch the IDs and lookup values the operation mix draws from"""
+    schools = make_request("GET", "spelltemplates/schools") or []
+    return {
+        "character_ids": [c['id'] for c in iter_records("characters")],
+        "item_template_ids": list(fetch_template_lookup("itemtemplates").values()),
+        "schools": schools or SPELL_SCHOOLS,
+    }
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[nearest_rank(pct, len(sorted_values)) - 1]
+
+def summarize_samples(samples):
+    """Group (offset, label, latency, ok) samples into per-label latency statistics"""
+    by_label = {}
+    for _, label, latency, ok in samples:
+        entry = by_label.setdefault(label, {"latencies": [], "errors": 0})
+        entry["latencies"].append(latency)
+        if not ok:
+            entry["errors"] += 1
+    
+    summary = {}
+    for label, entry in sorted(by_label.items()):
+        latencies = sorted(entry["latencies"])
+        summary[label] = {
+            "count": len(latencies),
+            "errors": entry["errors"],
+            "error_rate": entry["errors"] / len(latencies),
+            "p50_ms": percentile(latencies, 50) * 1000,
+            "p95_ms": percentile(latencies, 95) * 1000,
+            "p99_ms": percentile(latencies, 99) * 1000,
+            "max_ms": latencies[-1] * 1000,
+        }
+    return summary
+
+def benchmark_timeseries(samples):
+    """Bucket samples per whole second of the run and per label"""
+    buckets = {}
+    for offset, label, latency, ok in samples:
+        buckets.setdefault((int(offset), label), []).append((latency, ok))
+    
+    rows = []
+    for (second, label), entries in sorted(buckets.items()):
+        latencies = sorted(latency for latency, _ in entries)
+        rows.append({
+            "second": second,
+            "endpoint": label,
+            "requests": len(entries),
+            "errors": sum(1 for _, ok in entries if not ok),
+            "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+            "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+            "max_ms": round(latencies[-1] * 1000, 3),
+        })
+    return rows
+
+def write_benchmark_output(path, summary, timeseries, run_info):
+    """Write the time series as CSV, or the summary plus time series as JSON"""
+    if path.endswith(".csv"):
+        with open(path, "w", newline="") as handle:
+            writer = csv.DictWriter(handle, fieldnames=list(timeseries[0]) if timeseries else ["second"])
+            writer.writeheader()
+            writer.writerows(timeseries)
+    else:
+        with open(path, "w") as handle:
+            json.dump({"run": run_info, "summary": summary, "timeseries": timeseries}, handle, indent=2)
+
+def run_benchmark(args):
+    """Replay the operation mix against the API and report per-endpoint latencies"""
+    mix = parse_weights(args.mix, BENCHMARK_MIX) if args.mix else dict(BENCHMARK_MIX)
+    unknown = set(mix) - set(BENCHMARK_MIX)
+    if unknown:
+        print(f"❌ Unknown benchmark operations: {', '.join(sorted(unknown))}")
+        return None
+    
+    print("⏱️  Starting benchmark")
+    print(f"Target URL: {args.base_url}")
+    print(f"Operations: {args.requests}, concurrency: {args.concurrency}, seed: {args.seed}")
+    print("-" * 50)
+    
+    context = load_benchmark_context()
+    if not context["character_ids"] or not context["item_template_ids"]:
+        print("❌ The benchmark needs existing characters and item templates - seed the database first")
+        return None
+    
+    start = time.perf_counter()
+    
+    def execute(operation):
+        label, method, endpoint, data = operation
+        began = time.perf_counter()
+        # Measured operations bypass the response cache so they always reach the server
+        result = make_request(method, endpoint, data, retries=1, use_cache=False)
+        return began - start, label, time.perf_counter() - began, result is not None
+    
+    plan = plan_benchmark(args.requests, mix, args.seed, context)
+    samples = list(get_runner().map(execute, plan))
+    elapsed = time.perf_counter() - start
+    
+    summary = summarize_samples(samples)
+    print(f"\n{'Endpoint':<40} {'count':>7} {'err%':>6} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8}")
+    for label, stats in summary.items():
+        print(f"{label:<40} {stats['count']:>7} {stats['error_rate'] * 100:>5.1f}% "
+              f"{stats['p50_ms']:>8.1f} {stats['p95_ms']:>8.1f} {stats['p99_ms']:>8.1f} {stats['max_ms']:>8.1f}")
+    print("-" * 50)
+    print(f"Throughput: {len(samples) / elapsed:.1f} req/s over {elapsed:.2f}s (latencies in ms)")
+    
+    if args.output:
+        run_info = {"base_url": args.base_url, "requests": args.requests, "concurrency": args.concurrency,
+                    "seed": args.seed, "mix": mix, "elapsed_s": elapsed}
+        write_benchmark_output(args.output, summary, benchmark_timeseries(samples), run_info)
+        print(f"📝 Wrote time series to {args.output}")
+    
+    return summary
+
+COMMANDS = ["seed", "benchmark"]
+
+def parse_args(argv=None):
+    """Parse command line options; the command defaults to "seed" """
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if not argv or argv[0] not in COMMANDS + ["-h", "--help"]:
+        argv = ["seed"] + argv
+    
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--base-url", default=BASE_URL, help="API base URL")
+    common.add_argument("--concurrency", type=int, default=SEED_CONCURRENCY,
+                        help="maximum number of requests in flight (1 = serial)")
+    common.add_argument("--rate-limit", type=float, default=SEED_RATE_LIMIT,
+                        help="maximum requests per second (default: unlimited)")
+    common.add_argument("--pool-size", type=int, default=POOL_MAXSIZE,
+                        help="keep-alive connections kept per host")
+    common.add_argument("--retries", type=int, default=RETRY_ATTEMPTS,
+                        help="attempts per request, including the first")
+    common.add_argument("--retry-budget", type=float, default=RETRY_BUDGET_RATIO,
+                        help="retries allowed as a fraction of all requests")
+    common.add_argument("--cache-ttl", type=float, default=CACHE_TTL,
+                        help="seconds template responses stay cached (0 disables the cache)")
+    common.add_argument("--cache-file", default=CACHE_PATH,
+                        help="SQLite file keeping cached responses between runs")
+    common.add_argument("--pagination", choices=["page", "keyset"], default=READ_PAGINATION,
+                        help="paging scheme for collection reads, if the API supports one")
+    common.add_argument("--page-size", type=int, default=READ_PAGE_SIZE)
+    common.add_argument("--compression", choices=["off", "responses", "both"], default=COMPRESSION,
+                        help="gzip responses, or responses and request bodies")
+    common.add_argument("--quiet", action="store_true",
+                        help="suppress per-record progress lines (much faster for large runs)")
+    common.add_argument("--trace", help="write one JSON line per HTTP request to this file")
+    common.add_argument("--profiler", choices=["cprofile", "pyinstrument"],
+                        help="profile the whole run (main thread only; use --concurrency 1 to include requests)")
+    common.add_argument("--profiler-output",
+                        help="write the profile here (.prof for cProfile, .html or text for pyinstrument) "
+                             "instead of printing it")
+    common.add_argument("--stand-in", action="store_true",
+                        help="run against an in-process stand-in API (stand_in_server.py) instead of --base-url")
+    common.add_argument("--stand-in-options",
+                        help='stand-in latency, faults and extensions, e.g. "latency=0.005,throttle_rate=0.02,batch=1"')
+    
+    parser = argparse.ArgumentParser(description="Seed or benchmark the Character Sheet Manager API")
+    commands = parser.add_subparsers(dest="command")
+    parser_seed = commands.add_parser("seed", parents=[common], help="clear the database and seed it")
+    parser_benchmark = commands.add_parser("benchmark", parents=[common],
+                                           help="replay a mix of operations and report latencies")
+    
+    parser_benchmark.add_argument("--requests", type=int, default=1000,
+                                  help="number of operations to replay")
+    parser_benchmark.add_argument("--mix", help='operation weights, e.g. "character_detail=5,by_class=1" '
+                                                f'(operations: {", ".join(BENCHMARK_MIX)})')
+    parser_benchmark.add_argument("--seed", type=int, default=0, help="random seed for the operation plan")
+    parser_benchmark.add_argument("--output", help="write the per-second time series to a .csv or .json file")
+    
+    parser_seed.add_argument("--batch-size", type=int, default=BATCH_SIZE,
+                             help="records per POST to <endpoint>/batch, falling back to single POSTs "
+                                  "when the backend has no batch endpoint")
+    parser_seed.add_argument("--journal", help="append-only JSONL checkpoint of created records")
+    parser_seed.add_argument("--resume", action="store_true",
+                             help="continue an interrupted run from --journal instead of clearing the database")
+    parser_seed.add_argument("--journal-batch", type=int, default=JOURNAL_BATCH_SIZE,
+                             help="journal entries buffered per write")
+    
+    data = parser_seed.add_argument_group("data")
+    data.add_argument("--profile", choices=["fixture", "synthetic"], default="fixture",
+                      help="hand-written fixture records or generated synthetic records")
+    data.add_argument("--seed", type=int, default=0, help="random seed for the synthetic profile")
+    data.add_argument("--item-templates", type=int, default=20)
+    data.add_argument("--spell-templates", type=int, default=20)
+    data.add_argument("--characters", type=int, default=20)
+    data.add_argument("--items", type=int, default=20)
+    data.add_argument("--spells", type=int, default=20)
+    data.add_argument("--class-weights", help='e.g. "Wizard=3,Fighter=1" (default: uniform)')
+    data.add_argument("--school-weights", help='e.g. "Evocation=4,Illusion=1" (default: uniform)')
+    data.add_argument("--category-weights", help='e.g. "Weapon=2,Armor=1" (default: uniform)')
+    data.add_argument("--portrait-size", type=parse_size, default=0,
+                      help='bytes per generated portrait image, e.g. "256k" (default: no portraits)')
+    data.add_argument("--portrait-dir", help="upload the image files in this directory as portraits instead")
+    data.add_argument("--portrait-ratio", type=float, default=PORTRAIT_RATIO,
+                      help="share of characters given a portrait")
+    data.add_argument("--portrait-samples", type=int, default=PORTRAIT_SAMPLES,
+                      help="characters per variant in the portrait cost report")
+    
+    sharding = parser_seed.add_argument_group(
+        "sharding", "split the characters, items and spells into shards seeded by separate processes, "
+                    "on this host or several: run --templates-only once, then each host with its --shard-index")
+    sharding.add_argument("--shard-count", type=int, default=1, help="number of shards the data is split into")
+    sharding.add_argument("--shard-index",
+                          help='shards seeded by this run, e.g. "0-3" or "4,5" (default: all, after clearing '
+                               'the database and creating the templates)')
+    sharding.add_argument("--processes", type=int,
+                          help="worker processes (default: one per CPU, at most one per shard); "
+                               "--concurrency applies to each, --rate-limit is split between them")
+    sharding.add_argument("--templates-only", action="store_true",
+                          help="clear the database and create the templates, without any characters")
+    
+    args = parser.parse_args(argv)
+    if args.command == "seed":
+        if args.shard_count < 1:
+            parser.error("--shard-count must be at least 1")
+        if args.processes is not None and args.processes < 1:
+            parser.error("--processes must be at least 1")
+        if args.shard_index is not None and args.templates_only:
+            parser.error("--templates-only cannot be combined with --shard-index")
+        try:
+            parse_shards(args.shard_index, args.shard_count)
+        except ValueError as e:
+            parser.error(str(e))
+    return args
+
+def dataset_from_args(args, character_range=None):
+    """Build the seeding dataset described by the command line options"""
+    dataset = build_dataset(
+        profile=args.profile,
+        seed=args.seed,
+        item_templates=args.item_templates,
+        spell_templates=args.spell_templates,
+        characters=args.characters,
+        items=args.items,
+        spells=args.spells,
+        class_weights=parse_weights(args.class_weights, CHARACTER_CLASSES),
+        school_weights=parse_weights(args.school_weights, SPELL_SCHOOLS),
+        category_weights=parse_weights(args.category_weights, ITEM_CATEGORIES),
+        character_range=character_range,
+    )
+    dataset["portraits"] = load_portraits(args.portrait_size, args.portrait_dir, args.seed)
+    if dataset["portraits"]:
+        dataset["characters"] = attach_portraits(dataset["characters"], dataset["portraits"],
+                                                 args.portrait_ratio, args.seed,
+                                                 character_range[0] if character_range else 0)
+    return dataset
+
+def main(args=None):
+    """Main seeding function - 100 fixture entries by default; returns whether it succeeded"""
+    args = args or parse_args()
+    instrumentation = configure_instrumentation(trace_path=args.trace, quiet=args.quiet)
+    stand_in = None
+    try:
+        with profiling(args.profiler, args.profiler_output):
+            if args.stand_in:
+                from stand_in_server import StandInServer, parse_options
+                stand_in = StandInServer(**parse_options(args.stand_in_options)).start()
+                args.base_url = stand_in.url
+            if stand_in is not None and args.command == "benchmark":
+                # A fresh stand-in is empty; give the benchmark the fixture records to work on
+                run(parse_args(["seed", "--base-url", args.base_url]))
+            return run(args)
+    finally:
+        if stand_in is not None:
+            stand_in.print_stats()
+            stand_in.stop()
+        instrumentation.close()
+        if args.trace:
+            print(f"📝 Wrote request trace to {args.trace}")
+
+def configure_from_args(args):
+    """Configure the shared client, runner, retry policy and cache from the command line options"""
+    configure_client(base_url=args.base_url, pool_maxsize=max(args.pool_size, args.concurrency),
+                     pagination=args.pagination, page_size=args.page_size,
+                     batch_size=getattr(args, "batch_size", BATCH_SIZE), compression=args.compression)
+    configure_runner(concurrency=args.concurrency, rate_limit=args.rate_limit)
+    configure_retry_policy(attempts=args.retries, budget_ratio=args.retry_budget)
+    configure_cache(ttl=args.cache_ttl, path=args.cache_file)
+
+def run(args):
+    """Run the seed or benchmark command described by `args`; returns whether it succeeded"""
+    configure_from_args(args)
+    
+    if args.command == "benchmark":
+        run_benchmark(args)
+        return True
+    
+    if args.resume and not args.journal:
+        print("❌ --resume needs --journal")
+        return
+    
+    dataset = dataset_from_args(args)
+    journal = None
+    shards = parse_shards(args.shard_index, args.shard_count)
+    sharded = args.shard_count > 1 or args.processes is not None
+    # A run given --shard-index is one part of a larger run: the templates and the
+    # clearing belong to the --templates-only run made before it
+    partial = args.shard_index is not None
+    
+    print(f"🚀 Starting Database Seeding - {args.profile} profile")
+    print(f"Target URL: {args.base_url}")
+    print(f"Concurrency: {args.concurrency}, rate limit: {args.rate_limit or 'unlimited'} req/s")
+    if partial:
+        print(f"Shards: {', '.join(map(str, shards))} of {args.shard_count}")
     print("-" * 50)
     
     try:
         # Test API connection
-        test_response = make_request("GET", "characters")
-        if test_response is None:
+        if not check_connection():
             print("❌ Cannot connect to API. Make sure your server is running at http://localhost:5000")
             return
         
         print("✅ API connection successful")
         
-        # Clear existing data
-        clear_database()
+        if args.journal and not partial:
+            journal = SeedJournal(args.journal, args.journal_batch, resume=args.resume)
+        
+        if args.resume:
+            created = f" ({len(journal)} records already created)" if journal is not None else ""
+            print(f"↺ Resuming from {args.journal}{created}")
+        elif not partial:
+            # Clear existing data; seeding on top of leftovers would mix two datasets
+            if not clear_database():
+                return
         
-        # Create exactly 100 entries
         print("\n" + "="*40)
         print("📦 CREATING DATA")
         print("="*40)
         
-        item_templates = seed_item_templates()    # 20 entries
-        spell_templates = seed_spell_templates()  # 20 entries
-        characters = seed_characters()            # 20 entries
-        items = seed_items(characters, item_templates)      # 20 entries
-        spells = seed_spells(characters, spell_templates)   # 20 entries
+        if partial:
+            item_templates = lookup_templates("itemtemplates", dataset["item_templates"])
+            spell_templates = lookup_templates("spelltemplates", dataset["spell_templates"])
+        else:
+            item_templates = seed_item_templates(dataset["item_templates"], journal)
+            spell_templates = seed_spell_templates(dataset["spell_templates"], journal)
+        
+        resumed, failed = 0, []
+        if args.templates_only:
+            characters, items, spells = [], [], []
+        elif sharded:
+            characters, items, spells, resumed, failed = seed_shards(args, shards, item_templates,
+                                                                     spell_templates)
+        else:
+            characters = seed_characters(dataset["characters"], journal)
+            items = seed_items(characters, item_templates, dataset["item_assignments"], journal)
+            spells = seed_spells(characters, spell_templates, dataset["spell_assignments"], journal)
+        
+        portrait_cost = None
+        if dataset["portraits"] and args.portrait_samples > 0 and not args.templates_only:
+            print("\nMeasuring portrait cost...")
+            portrait_cost = measure_portrait_cost(dataset["portraits"][0], args.portrait_samples)
         
         # Summary
         print("\n" + "="*50)
         print("📊 FINAL SUMMARY")
         print("="*50)
-        print(f"Item Templates: {len(item_templates)}")
-        print(f"Spell Templates: {len(spell_templates)}")
-        print(f"Characters: {len(characters)}")
+        existing = " (existing, not created)" if partial else ""
+        print(f"Item Templates: {len(item_templates)}{existing}")
+        print(f"Spell Templates: {len(spell_templates)}{existing}")
+        print(f"Characters: {count_created(characters)}")
         print(f"Items: {len(items)}")
         print(f"Spells: {len(spells)}")
         print("-" * 50)
-        total = len(item_templates) + len(spell_templates) + len(characters) + len(items) + len(spells)
-        print(f"TOTAL ENTRIES CREATED: {total}")
+        total = count_created(characters) + len(items) + len(spells)
+        if not partial:
+            total += len(item_templates) + len(spell_templates)
+        # The counts above include records taken from the journal; those were created by an earlier run
+        resumed += journal.resumed if journal is not None else 0
+        print(f"TOTAL ENTRIES CREATED: {total - resumed}")
+        if journal is not None or resumed:
+            print(f"Resumed from journal: {resumed}")
+        print("-" * 50)
+        print_client_stats()
+        print_retry_stats()
+        print_cache_stats()
+        print("-" * 50)
+        print_request_summary()
+        print("-" * 50)
+        if portrait_cost is not None:
+            print_portrait_cost(portrait_cost, dataset["portraits"][0])
+            if args.stand_in:
+                print("(peak memory includes the in-process stand-in server's share of each request)")
+            print("-" * 50)
+        print_throughput()
+        if failed:
+            indexes = ",".join(map(str, failed))
+            print(f"\n❌ Shard{'s' if len(failed) > 1 else ''} {indexes} of {args.shard_count} failed - "
+                  f"re-run with --shard-index {indexes}")
+            return False
         print("\n✅ Database seeding completed successfully!")
         print(f"🌐 Visit http://localhost:5000 to see your data!")
+        return True
         
     except Exception as e:
         print(f"\n❌ Error during seeding: {e}")
         import traceback
         traceback.print_exc()
+    
+    finally:
+        if journal is not None:
+            journal.close()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(0 if main() else 1)
\ No newline at end of file
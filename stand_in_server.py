@@ -0,0 +1,990 @@
+"""In-memory stand-in for the Character Sheet Manager API.
+
+Serves the same routes, DTO shapes, validation rules and error responses as the
+ASP.NET controllers under backend/, without .NET or SQL Server, so input_script.py
+can be benchmarked and tested on a machine with no services installed. Latency,
+5xx errors and 429 responses can be injected to exercise the client's
+concurrency, retry and caching behaviour.
+
+    python stand_in_server.py --port 5126 --latency 0.005 --throttle-rate 0.02
+
+or in-process from the seeder:
+
+    python input_script.py seed --stand-in --stand-in-options "latency=0.005,error_rate=0.01"
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from collections import namedtuple
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 5126
+GZIP_LEVEL = 1    # CompressionLevel.Fastest, the GzipCompressionProvider default
+
+STAT_FIELDS = ["strength", "dexterity", "constitution", "intelligence", "wisdom", "charisma"]
+BONUS_FIELDS = [f"{stat}Bonus" for stat in STAT_FIELDS] + ["armorBonus"]
+SPELL_TEMPLATE_FIELDS = ["level", "school", "castingTime", "range", "components", "duration"]
+
+# ---------------------------------------------------------------------------
+# Errors
+# ---------------------------------------------------------------------------
+
+class ApiError(Exception):
+    """An exception ExceptionMiddleware turns into an ErrorResponse"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+class NotFound(ApiError):
+    def __init__(self, entity, id):
+        super().__init__(404, f"{entity} with id {id} was not found")
+
+class Invalid(ApiError):
+    def __init__(self, message):
+        super().__init__(400, message)
+
+class ModelInvalid(Exception):
+    """A model binding failure [ApiController] answers with ValidationProblemDetails"""
+
+    def __init__(self, errors):
+        super().__init__("One or more validation errors occurred.")
+        self.errors = errors
+
+def utc_now():
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+def error_response(status, message):
+    """The camelCase ErrorResponse body written by ExceptionMiddleware"""
+    return {"message": message, "statusCode": status, "timestamp": utc_now()}
+
+def problem_details(errors):
+    return {
+        "type": "https://tools.ietf.org/html/rfc9110#section-15.5.1",
+        "title": "One or more validation errors occurred.",
+        "status": 400,
+        "errors": errors,
+    }
+
+# ---------------------------------------------------------------------------
+# Request DTOs
+# ---------------------------------------------------------------------------
+
+# kind is "int", "str" or "bool"; lo/hi are a [Range] for ints and a [StringLength] for strings
+Field = namedtuple("Field", "kind default required nullable lo hi", defaults=(None, False, True, None, None))
+
+def _name(hi):
+    return Field("str", "", required=True, nullable=False, lo=1, hi=hi)
+
+def _int(lo, hi, default=0):
+    return Field("int", default, nullable=False, lo=lo, hi=hi)
+
+def _text(hi, default=""):
+    return Field("str", default, nullable=default is None, hi=hi)
+
+def _bonus(hi=10):
+    return Field("int", None, lo=-10, hi=hi)
+
+_BONUSES = {field: _bonus(20 if field == "armorBonus" else 10) for field in BONUS_FIELDS}
+_OVERRIDES = {field: Field("int", None) for field in BONUS_FIELDS}
+
+DTOS = {
+    "CreateCharacterDto": {
+        "name": _name(100), "class": _name(50),
+        "level": _int(1, 20, 1), "armorClass": _int(1, 30, 10),
+        **{stat: _int(1, 20, 10) for stat in STAT_FIELDS},
+        "imageBase64": Field("str", None),
+    },
+    "UpdateCharacterDto": {
+        "name": _name(100), "class": _name(50),
+        "level": _int(1, 20), "armorClass": _int(1, 30),
+        **{stat: _int(1, 20) for stat in STAT_FIELDS},
+        "imageBase64": Field("str", None),
+    },
+    "PatchCharacterDto": {
+        "name": Field("str", None, lo=1, hi=100), "class": Field("str", None, lo=1, hi=50),
+        "level": Field("int", None, lo=1, hi=20), "armorClass": Field("int", None, lo=1, hi=30),
+        **{stat: Field("int", None, lo=1, hi=20) for stat in STAT_FIELDS},
+        "imageBase64": Field("str", None),
+    },
+    "CreateItemDto": {
+        "name": _name(100), "effect": _text(500), **_BONUSES,
+        "itemTemplateId": Field("int", None), "characterId": _int(None, None),
+    },
+    "UpdateItemDto": {
+        "name": _name(100), "effect": _text(500), **_BONUSES,
+        "itemTemplateId": Field("int", None),
+    },
+    "CreateItemFromTemplateDto": {
+        "itemTemplateId": _int(None, None), "characterId": _int(None, None),
+        "customName": Field("str", None), "customEffect": Field("str", None), **_OVERRIDES,
+    },
+    "CreateSpellDto": {
+        "name": _name(100), "effect": _text(500), "damage": _text(50, None),
+        "spellTemplateId": Field("int", None), "characterId": _int(None, None),
+    },
+    "UpdateSpellDto": {
+        "name": _name(100), "effect": _text(500), "damage": _text(50, None),
+        "spellTemplateId": Field("int", None),
+    },
+    "CreateSpellFromTemplateDto": {
+        "spellTemplateId": _int(None, None), "characterId": _int(None, None),
+        "customName": Field("str", None), "customEffect": Field("str", None),
+        "customDamage": Field("str", None),
+    },
+    "CreateItemTemplateDto": {
+        "name": _name(100), "effect": _text(500), **_BONUSES,
+        "category": _text(50, "Miscellaneous"), "isActive": Field("bool", True, nullable=False),
+    },
+    "CreateSpellTemplateDto": {
+        "name": _name(100), "effect": _text(500), "damage": _text(50, None),
+        "level": _int(0, 9, 1), "school": _text(50, "Evocation"),
+        "castingTime": _text(50, "1 action"), "range": _text(50, "Touch"),
+        "components": _text(100, "V, S"), "duration": _text(50, "Instantaneous"),
+        "isActive": Field("bool", True, nullable=False),
+    },
+    "UpdateSpellTemplateDto": {
+        "name": _name(100), "effect": _text(500), "damage": _text(50, None),
+        "level": _int(0, 9), "school": _text(50), "castingTime": _text(50), "range": _text(50),
+        "components": _text(100), "duration": _text(50),
+        "isActive": Field("bool", True, nullable=False),
+    },
+}
+DTOS["UpdateItemTemplateDto"] = DTOS["CreateItemTemplateDto"]
+
+_JSON_TYPES = {"int": "System.Int32", "str": "System.String", "bool": "System.Boolean"}
+
+def _matches(kind, value):
+    if kind == "int":
+        return isinstance(value, int) and not isinstance(value, bool)
+    if kind == "bool":
+        return isinstance(value, bool)
+    return isinstance(value, str)
+
+def bind(dto, body):
+    """Bind a JSON body to a request DTO the way System.Text.Json and [ApiController] do.
+
+    Property names match case-insensitively, missing properties take the DTO
+    default, and data annotation failures raise ModelInvalid.
+    """
+    if not isinstance(body, dict):
+        raise ModelInvalid({"$": [f"The JSON value could not be converted to {dto}."]})
+    fields = DTOS[dto]
+    supplied = {key.lower(): value for key, value in body.items()}
+    bound, errors = {}, {}
+    for name, field in fields.items():
+        label = name[0].upper() + name[1:]
+        value = supplied.get(name.lower(), field.default)
+        # <Nullable>enable</Nullable> makes every non-nullable string implicitly [Required]
+        required = field.required or (field.kind == "str" and not field.nullable)
+        if value is None and not field.nullable and field.kind != "str" and name.lower() in supplied:
+            errors[f"$.{name}"] = [f"The JSON value could not be converted to {_JSON_TYPES[field.kind]}."]
+            continue
+        if value is not None and not _matches(field.kind, value):
+            errors[f"$.{name}"] = [f"The JSON value could not be converted to {_JSON_TYPES[field.kind]}."]
+            continue
+        bound[name] = value
+        if required and (value is None or value == ""):
+            errors[label] = [f"The {label} field is required."]
+        elif value is None:
+            continue
+        elif field.kind == "int" and field.lo is not None and not field.lo <= value <= field.hi:
+            errors[label] = [f"The field {label} must be between {field.lo} and {field.hi}."]
+        elif field.kind == "str" and field.hi is not None and not (field.lo or 0) <= len(value) <= field.hi:
+            if field.lo:
+                errors[label] = [f"The field {label} must be a string with a minimum length of "
+                                 f"{field.lo} and a maximum length of {field.hi}."]
+            else:
+                errors[label] = [f"The field {label} must be a string with a maximum length of {field.hi}."]
+    if errors:
+        raise ModelInvalid(errors)
+    if dto == "PatchCharacterDto":
+        # Only the properties present in the request are applied
+        bound = {name: value for name, value in bound.items() if value is not None}
+    return bound
+
+# ---------------------------------------------------------------------------
+# Business rules (Services/*.cs)
+# ---------------------------------------------------------------------------
+
+def validate_character_stats(character):
+    stats = [character[stat] for stat in STAT_FIELDS]
+    if any(stat < 1 or stat > 20 for stat in stats):
+        raise Invalid("All character stats must be between 1 and 20")
+    if sum(stats) > 90:
+        raise Invalid(f"Total character stats cannot exceed 90. Current total: {sum(stats)}")
+
+def validate_bonuses(record):
+    bonuses = [record.get(f"{stat}Bonus") for stat in STAT_FIELDS]
+    armor = record.get("armorBonus")
+    if any(bonus is not None and not -10 <= bonus <= 10 for bonus in bonuses):
+        raise Invalid("Stat bonuses must be between -10 and 10")
+    if armor is not None and not -10 <= armor <= 20:
+        raise Invalid("Armor bonus must be between -10 and 20")
+    total = sum(bonus for bonus in bonuses + [armor] if bonus is not None and bonus > 0)
+    if total > 15:
+        raise Invalid(f"Total positive bonuses cannot exceed 15. Current total: {total}")
+
+def valid_damage(damage):
+    if not damage or not damage.strip():
+        return True
+    if "d" in damage or "mod" in damage.lower():
+        return True
+    try:
+        int(damage)
+        return True
+    except ValueError:
+        return False
+
+def validate_spell(record):
+    if not (record.get("name") or "").strip():
+        raise Invalid("Spell name cannot be empty")
+    if not valid_damage(record.get("damage")):
+        raise Invalid("Invalid damage format. Use dice notation like '1d6', '2d8+3', etc.")
+
+def validate_item_template(record):
+    if not (record.get("name") or "").strip():
+        raise Invalid("Template name cannot be empty")
+    if not (record.get("category") or "").strip():
+        raise Invalid("Template category cannot be empty")
+    validate_bonuses(record)
+
+def validate_spell_template(record):
+    if not (record.get("name") or "").strip():
+        raise Invalid("Template name cannot be empty")
+    if not 0 <= record["level"] <= 9:
+        raise Invalid("Spell level must be between 0 and 9")
+    for field, label in [("school", "School"), ("castingTime", "Casting time"), ("range", "Range"),
+                         ("components", "Components"), ("duration", "Duration")]:
+        if not (record.get(field) or "").strip():
+            raise Invalid(f"{label} cannot be empty")
+    if not valid_damage(record.get("damage")):
+        raise Invalid("Invalid damage format. Use dice notation like '1d6', '2d8+3', etc.")
+
+def can_learn(character, template):
+    """SpellService.CanCharacterLearnSpell"""
+    return template["level"] == 0 or character["level"] >= template["level"] * 2 - 1
+
+# ---------------------------------------------------------------------------
+# In-memory store
+# ---------------------------------------------------------------------------
+
+class Store:
+    """The five tables, with the Character -> Items/Spells cascade of AppDbContext"""
+
+    TABLES = ["characters", "items", "spells", "itemtemplates", "spelltemplates"]
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.tables = {table: {} for table in self.TABLES}
+        self.next_id = {table: 1 for table in self.TABLES}
+        self.owned = {"items": {}, "spells": {}}   # character id -> set of item/spell ids
+
+    def insert(self, table, record):
+        record["id"] = self.next_id[table]
+        self.next_id[table] += 1
+        self.tables[table][record["id"]] = record
+        if table in self.owned:
+            self.owned[table].setdefault(record["characterId"], set()).add(record["id"])
+        return record
+
+    def get(self, table, id, entity):
+        record = self.tables[table].get(id)
+        if record is None:
+            raise NotFound(entity, id)
+        return record
+
+    def delete(self, table, id, entity):
+        record = self.get(table, id, entity)
+        if table == "characters":
+            for child in self.owned:
+                for child_id in self.owned[child].pop(id, ()):
+                    del self.tables[child][child_id]
+        elif table in self.owned:
+            self.owned[table][record["characterId"]].discard(id)
+        else:
+            # Template foreign keys are not configured to cascade; SQL Server rejects the delete
+            reference = "itemTemplateId" if table == "itemtemplates" else "spellTemplateId"
+            child = "items" if table == "itemtemplates" else "spells"
+            if any(row.get(reference) == id for row in self.tables[child].values()):
+                raise ApiError(500, "An internal server error occurred")
+        del self.tables[table][id]
+
+    def owned_by(self, table, character_id):
+        return [self.tables[table][id] for id in sorted(self.owned[table].get(character_id, ()))]
+
+# ---------------------------------------------------------------------------
+# Response DTOs (Mapping/MappingProfile.cs)
+# ---------------------------------------------------------------------------
+
+def character_summary(character):
+    return {key: character[key] for key in
+            ["id", "name", "class", "level", "armorClass", "imageBase64", "createdAt"]}
+
+def item_dto(store, item, nested=False):
+    template = store.tables["itemtemplates"].get(item.get("itemTemplateId"))
+    dto = {key: item.get(key) for key in ["id", "name", "effect"] + BONUS_FIELDS + ["itemTemplateId"]}
+    dto["itemTemplateName"] = template["name"] if template else None
+    if not nested:
+        dto["characterId"] = item["characterId"]
+        dto["characterName"] = store.tables["characters"][item["characterId"]]["name"]
+    return dto
+
+def spell_dto(store, spell, nested=False):
+    template = store.tables["spelltemplates"].get(spell.get("spellTemplateId"))
+    dto = {key: spell.get(key) for key in ["id", "name", "effect", "damage", "spellTemplateId"]}
+    dto["spellTemplateName"] = template["name"] if template else None
+    if not nested:
+        dto["characterId"] = spell["characterId"]
+        dto["characterName"] = store.tables["characters"][spell["characterId"]]["name"]
+        dto.update({field: template[field] if template else None for field in SPELL_TEMPLATE_FIELDS})
+    return dto
+
+def character_dto(store, character):
+    dto = {key: value for key, value in character.items()}
+    dto["items"] = [item_dto(store, item, nested=True) for item in store.owned_by("items", character["id"])]
+    dto["spells"] = [spell_dto(store, spell, nested=True) for spell in store.owned_by("spells", character["id"])]
+    return dto
+
+def template_dto(store, template):
+    return dict(template)
+
+# ---------------------------------------------------------------------------
+# Controllers
+# ---------------------------------------------------------------------------
+
+Response = namedtuple("Response", "status body location", defaults=(None,))
+
+class StandInApi:
+    """Route table and handlers mirroring Controllers/*.cs"""
+
+    def __init__(self, store=None, batch=False, pagination=False):
+        self.store = store or Store()
+        self.batch = batch
+        self.pagination = pagination
+        self.routes = []
+        for resource, entity in [("characters", "Character"), ("items", "Item"), ("spells", "Spell"),
+                                 ("itemtemplates", "ItemTemplate"), ("spelltemplates", "SpellTemplate")]:
+            self._resource_routes(resource, entity)
+        self.route("GET", r"characters/by-class/(?P<name>[^/]+)", self.characters_by_class)
+        self.route("GET", r"characters/by-level", self.characters_by_level)
+        self.route("GET", r"items/by-character/(?P<id>-?\d+)", self.owned_by_character("items", item_dto))
+        self.route("GET", r"spells/by-character/(?P<id>-?\d+)", self.owned_by_character("spells", spell_dto))
+        self.route("POST", r"items/from-template", self.create_item_from_template)
+        self.route("POST", r"spells/from-template", self.create_spell_from_template)
+        self.route("GET", r"itemtemplates/active", self.active_templates("itemtemplates", "category"))
+        self.route("GET", r"itemtemplates/by-category/(?P<name>[^/]+)", self.item_templates_by_category)
+        self.route("GET", r"itemtemplates/categories", self.distinct_values("itemtemplates", "category"))
+        self.route("GET", r"spelltemplates/active", self.active_templates("spelltemplates", "level"))
+        self.route("GET", r"spelltemplates/by-level/(?P<id>-?\d+)", self.spell_templates_by_level)
+        self.route("GET", r"spelltemplates/by-school/(?P<name>[^/]+)", self.spell_templates_by_school)
+        self.route("GET", r"spelltemplates/schools", self.distinct_values("spelltemplates", "school"))
+        if batch:
+            for method, pattern, handler in list(self.routes):
+                if method == "POST":
+                    self.routes.append(("POST", re.compile(pattern.pattern[:-1] + "/batch$", re.IGNORECASE),
+                                        self.batched(handler)))
+
+    def route(self, method, pattern, handler):
+        # ASP.NET route matching ignores case
+        self.routes.append((method, re.compile(f"^{pattern}$", re.IGNORECASE), handler))
+
+    def dispatch(self, method, path, query, body):
+        """Return a Response for an /api-relative path; 404/405 for unknown routes like ASP.NET routing"""
+        allowed = []
+        for route_method, pattern, handler in self.routes:
+            match = pattern.match(path)
+            if not match:
+                continue
+            if route_method != method:
+                allowed.append(route_method)
+                continue
+            params = {key: (int(value) if key == "id" else unquote(value))
+                      for key, value in match.groupdict().items()}
+            try:
+                with self.store.lock:
+                    return handler(query=query, body=body, **params)
+            except ApiError as e:
+                return Response(e.status, error_response(e.status, e.message))
+            except ModelInvalid as e:
+                return Response(400, problem_details(e.errors))
+        if allowed:
+            return Response(405, None, ", ".join(sorted(set(allowed))))
+        return Response(404, None)
+
+    # -- generic CRUD --------------------------------------------------------
+
+    def _resource_routes(self, resource, entity):
+        order = {"characters": "name", "items": "name", "spells": "name",
+                 "itemtemplates": "category", "spelltemplates": "level"}[resource]
+        self.route("GET", resource, lambda query, body: self.listing(resource, order, query))
+        self.route("GET", rf"{resource}/(?P<id>-?\d+)",
+                   lambda query, body, id: Response(200, self.to_dto(resource, self.store.get(resource, id, entity))))
+        self.route("POST", resource, getattr(self, f"create_{resource}"))
+        self.route("PUT", rf"{resource}/(?P<id>-?\d+)", getattr(self, f"update_{resource}"))
+        patch = self.patch_characters if resource == "characters" else getattr(self, f"update_{resource}")
+        self.route("PATCH", rf"{resource}/(?P<id>-?\d+)", patch)
+        self.route("DELETE", rf"{resource}/(?P<id>-?\d+)", lambda query, body, id: self.delete(resource, entity, id))
+
+    def to_dto(self, resource, record):
+        if resource == "characters":
+            return character_dto(self.store, record)
+        if resource == "items":
+            return item_dto(self.store, record)
+        if resource == "spells":
+            return spell_dto(self.store, record)
+        return template_dto(self.store, record)
+
+    def listing(self, resource, order, query, records=None, summary=None):
+        records = self.store.tables[resource].values() if records is None else records
+        records = self.paginate(sorted(records, key=lambda record: (record[order], record["id"])), query)
+        summary = summary or (character_summary if resource == "characters"
+                              else lambda record: self.to_dto(resource, record))
+        return Response(200, [summary(record) for record in records])
+
+    def paginate(self, records, query):
+        """Honour ?page&pageSize or ?afterId&limit when enabled; the real API ignores both"""
+        if not self.pagination:
+            return records
+        try:
+            if "afterId" in query:
+                after_id, limit = int(query["afterId"]), int(query.get("limit", len(records)))
+                return sorted((record for record in records if record["id"] > after_id),
+                              key=lambda record: record["id"])[:limit]
+            if "page" in query:
+                page, size = int(query["page"]), int(query.get("pageSize", len(records)))
+                return records[(page - 1) * size:page * size]
+        except ValueError:
+            raise ModelInvalid({"page": ["The value is not valid."]})
+        return records
+
+    def delete(self, resource, entity, id):
+        self.store.delete(resource, id, entity)
+        return Response(204, None)
+
+    def created(self, resource, record):
+        return Response(201, self.to_dto(resource, record), f"{resource}/{record['id']}")
+
+    def batched(self, handler):
+        def create_batch(query, body, **params):
+            if not isinstance(body, list):
+                raise ModelInvalid({"$": ["The JSON value could not be converted to a list."]})
+            results = []
+            for payload in body:
+                try:
+                    results.append(handler(query=query, body=payload, **params).body)
+                except (ApiError, ModelInvalid):
+                    results.append(None)
+            return Response(200, results)
+        return create_batch
+
+    # -- characters ----------------------------------------------------------
+
+    def create_characters(self, query, body):
+        character = bind("CreateCharacterDto", body)
+        validate_character_stats(character)
+        character["createdAt"] = character["updatedAt"] = utc_now()
+        return self.created("characters", self.store.insert("characters", self._character_record(character)))
+
+    def update_characters(self, query, body, id):
+        existing = self.store.get("characters", id, "Character")
+        update = bind("UpdateCharacterDto", body)
+        validate_character_stats(update)
+        existing.update(update, updatedAt=utc_now())
+        return Response(200, character_dto(self.store, existing))
+
+    def patch_characters(self, query, body, id):
+        existing = self.store.get("characters", id, "Character")
+        patch = bind("PatchCharacterDto", body)
+        candidate = {**existing, **patch}
+        if any(stat in patch for stat in STAT_FIELDS):
+            validate_character_stats(candidate)
+        existing.update(patch, updatedAt=utc_now())
+        return Response(200, character_dto(self.store, existing))
+
+    @staticmethod
+    def _character_record(character):
+        keys = ["name", "class", "level", "armorClass"] + STAT_FIELDS + ["imageBase64", "createdAt", "updatedAt"]
+        return {key: character[key] for key in keys}
+
+    def characters_by_class(self, query, body, name):
+        if not name.strip():
+            raise Invalid("Class name cannot be empty")
+        records = [c for c in self.store.tables["characters"].values() if c["class"].lower() == name.lower()]
+        return self.listing("characters", "name", query, records)
+
+    def characters_by_level(self, query, body):
+        try:
+            min_level, max_level = int(query.get("minLevel", 0)), int(query.get("maxLevel", 0))
+        except ValueError:
+            raise ModelInvalid({"minLevel": ["The value is not valid."]})
+        if min_level < 1 or max_level < 1 or min_level > max_level:
+            raise Invalid("Invalid level range")
+        records = [c for c in self.store.tables["characters"].values() if min_level <= c["level"] <= max_level]
+        return self.listing("characters", "level", query, records)
+
+    # -- items and spells ----------------------------------------------------
+
+    def owned_by_character(self, resource, dto):
+        def handler(query, body, id):
+            self.store.get("characters", id, "Character")
+            records = self.store.owned_by(resource, id)
+            return self.listing(resource, "name", query, records)
+        return handler
+
+    def _check_template(self, table, entity, template_id):
+        if template_id is not None:
+            self.store.get(table, template_id, entity)
+
+    def create_items(self, query, body):
+        item = bind("CreateItemDto", body)
+        self.store.get("characters", item["characterId"], "Character")
+        self._check_template("itemtemplates", "ItemTemplate", item["itemTemplateId"])
+        validate_bonuses(item)
+        return self.created("items", self.store.insert("items", item))
+
+    def create_item_from_template(self, query, body):
+        request = bind("CreateItemFromTemplateDto", body)
+        self.store.get("characters", request["characterId"], "Character")
+        template = self.store.get("itemtemplates", request["itemTemplateId"], "ItemTemplate")
+        if not template["isActive"]:
+            raise Invalid("Cannot create item from inactive template")
+        item = {
+            "name": request["customName"] if request["customName"] is not None else template["name"],
+            "effect": request["customEffect"] if request["customEffect"] is not None else template["effect"],
+            **{field: request[field] if request[field] is not None else template[field] for field in BONUS_FIELDS},
+            "itemTemplateId": template["id"],
+            "characterId": request["characterId"],
+        }
+        validate_bonuses(item)
+        return self.created("items", self.store.insert("items", item))
+
+    def update_items(self, query, body, id):
+        existing = self.store.get("items", id, "Item")
+        update = bind("UpdateItemDto", body)
+        self._check_template("itemtemplates", "ItemTemplate", update["itemTemplateId"])
+        validate_bonuses(update)
+        existing.update(update)
+        return Response(200, item_dto(self.store, existing))
+
+    def create_spells(self, query, body):
+        spell = bind("CreateSpellDto", body)
+        self.store.get("characters", spell["characterId"], "Character")
+        self._check_template("spelltemplates", "SpellTemplate", spell["spellTemplateId"])
+        validate_spell(spell)
+        return self.created("spells", self.store.insert("spells", spell))
+
+    def create_spell_from_template(self, query, body):
+        request = bind("CreateSpellFromTemplateDto", body)
+        character = self.store.get("characters", request["characterId"], "Character")
+        template = self.store.get("spelltemplates", request["spellTemplateId"], "SpellTemplate")
+        if not template["isActive"]:
+            raise Invalid("Cannot create spell from inactive template")
+        if not can_learn(character, template):
+            raise Invalid(f"Character level {character['level']} is too low to learn a level "
+                          f"{template['level']} spell")
+        spell = {
+            "name": request["customName"] if request["customName"] is not None else template["name"],
+            "effect": request["customEffect"] if request["customEffect"] is not None else template["effect"],
+            "damage": request["customDamage"] if request["customDamage"] is not None else template["damage"],
+            "spellTemplateId": template["id"],
+            "characterId": request["characterId"],
+        }
+        validate_spell(spell)
+        return self.created("spells", self.store.insert("spells", spell))
+
+    def update_spells(self, query, body, id):
+        existing = self.store.get("spells", id, "Spell")
+        update = bind("UpdateSpellDto", body)
+        self._check_template("spelltemplates", "SpellTemplate", update["spellTemplateId"])
+        validate_spell(update)
+        existing.update(update)
+        return Response(200, spell_dto(self.store, existing))
+
+    # -- templates -----------------------------------------------------------
+
+    def create_itemtemplates(self, query, body):
+        template = bind("CreateItemTemplateDto", body)
+        validate_item_template(template)
+        template["createdAt"] = template["updatedAt"] = utc_now()
+        return self.created("itemtemplates", self.store.insert("itemtemplates", template))
+
+    def update_itemtemplates(self, query, body, id):
+        existing = self.store.get("itemtemplates", id, "ItemTemplate")
+        update = bind("UpdateItemTemplateDto", body)
+        validate_item_template(update)
+        existing.update(update, updatedAt=utc_now())
+        return Response(200, template_dto(self.store, existing))
+
+    def create_spelltemplates(self, query, body):
+        template = bind("CreateSpellTemplateDto", body)
+        validate_spell_template(template)
+        template["createdAt"] = template["updatedAt"] = utc_now()
+        return self.created("spelltemplates", self.store.insert("spelltemplates", template))
+
+    def update_spelltemplates(self, query, body, id):
+        existing = self.store.get("spelltemplates", id, "SpellTemplate")
+        update = bind("UpdateSpellTemplateDto", body)
+        validate_spell_template(update)
+        existing.update(update, updatedAt=utc_now())
+        return Response(200, template_dto(self.store, existing))
+
+    def _active(self, table):
+        return [template for template in self.store.tables[table].values() if template["isActive"]]
+
+    def active_templates(self, table, order):
+        return lambda query, body: self.listing(table, order, query, self._active(table))
+
+    def distinct_values(self, table, field):
+        return lambda query, body: Response(200, sorted({template[field] for template in self._active(table)}))
+
+    def item_templates_by_category(self, query, body, name):
+        if not name.strip():
+            raise Invalid("Category cannot be empty")
+        records = [t for t in self._active("itemtemplates") if t["category"].lower() == name.lower()]
+        return self.listing("itemtemplates", "name", query, records)
+
+    def spell_templates_by_level(self, query, body, id):
+        if not 0 <= id <= 9:
+            raise Invalid("Spell level must be between 0 and 9")
+        records = [t for t in self._active("spelltemplates") if t["level"] == id]
+        return self.listing("spelltemplates", "school", query, records)
+
+    def spell_templates_by_school(self, query, body, name):
+        if not name.strip():
+            raise Invalid("School cannot be empty")
+        records = [t for t in self._active("spelltemplates") if t["school"].lower() == name.lower()]
+        return self.listing("spelltemplates", "level", query, records)
+
+# ---------------------------------------------------------------------------
+# Fault injection
+# ---------------------------------------------------------------------------
+
+class FaultInjector:
+    """Injected latency, 5xx errors and 429 throttling, drawn from one seeded RNG.
+
+    `error_rate` fails requests before they are handled; `commit_error_rate` fails
+    writes after they were applied, the ambiguous case the client reconciles.
+    """
+
+    def __init__(self, latency=0.0, jitter=0.0, error_rate=0.0, commit_error_rate=0.0,
+                 throttle_rate=0.0, retry_after=1, seed=None):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.commit_error_rate = commit_error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def _draw(self):
+        with self._lock:
+            return self._rng.random()
+
+    def delay(self):
+        if not self.latency and not self.jitter:
+            return 0.0
+        with self._lock:
+            return self.latency + self._rng.uniform(0, self.jitter)
+
+    def before(self):
+        """Return the fault to answer with instead of handling the request, if any"""
+        if self.throttle_rate and self._draw() < self.throttle_rate:
+            return "throttle"
+        if self.error_rate and self._draw() < self.error_rate:
+            return "error"
+        return None
+
+    def after_commit(self, method):
+        return method != "GET" and self.commit_error_rate and self._draw() < self.commit_error_rate
+
+# ---------------------------------------------------------------------------
+# HTTP server
+# ---------------------------------------------------------------------------
+
+class StandInRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"     # keep-alive, like Kestrel
+    disable_nagle_algorithm = True    # headers and body go out without waiting for delayed ACKs
+    server_version = "Kestrel"
+    sys_version = ""
+
+    def do_GET(self):
+        self.handle_api("GET")
+
+    def do_POST(self):
+        self.handle_api("POST")
+
+    def do_PUT(self):
+        self.handle_api("PUT")
+
+    def do_PATCH(self):
+        self.handle_api("PATCH")
+
+    def do_DELETE(self):
+        self.handle_api("DELETE")
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def read_chunked(self):
+        parts = []
+        while True:
+            size = int(self.rfile.readline().split(b";")[0].strip() or b"0", 16)
+            if not size:
+                break
+            parts.append(self.rfile.read(size))
+            self.rfile.readline()
+        while self.rfile.readline().strip():    # trailers
+            pass
+        return b"".join(parts)
+
+    def read_body(self):
+        if "chunked" in self.headers.get("Transfer-Encoding", "").lower():
+            raw = self.read_chunked()
+        else:
+            length = int(self.headers.get("Content-Length") or 0)
+            raw = self.rfile.read(length) if length else b""
+        if not raw:
+            return None
+        try:
+            if self.headers.get("Content-Encoding", "").lower() == "gzip":
+                raw = gzip.decompress(raw)
+            return json.loads(raw)
+        except (ValueError, OSError, EOFError):
+            raise ModelInvalid({"$": ["The input does not contain any JSON tokens or is not valid JSON."]})
+
+    def handle_api(self, method):
+        server = self.server
+        server.record_start()
+        status = 500
+        try:
+            with server.workers:
+                delay = server.faults.delay()
+                if delay:
+                    time.sleep(delay)
+                status = self.respond(method)
+        finally:
+            server.record_end(status)
+
+    def respond(self, method):
+        server = self.server
+        try:
+            body = self.read_body()
+        except ModelInvalid as e:
+            return self.send(400, problem_details(e.errors))
+
+        url = urlsplit(self.path)
+        if not url.path.lower().startswith("/api/"):
+            return self.send(404, None)
+        fault = server.faults.before()
+        if fault == "throttle":
+            return self.send(429, error_response(429, "Too many requests"),
+                             {"Retry-After": str(server.faults.retry_after)})
+        if fault == "error":
+            return self.send(500, error_response(500, "An internal server error occurred"))
+
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        response = server.api.dispatch(method, url.path[len("/api/"):].strip("/"), query, body)
+        if response.status < 400 and server.faults.after_commit(method):
+            return self.send(500, error_response(500, "An internal server error occurred"))
+        headers = {}
+        if response.status == 405:
+            headers["Allow"] = response.location
+        elif response.location:
+            headers["Location"] = f"http://{self.headers.get('Host', '')}/api/{response.location}"
+        return self.send(response.status, response.body, headers, method)
+
+    def send(self, status, body, headers=None, method=None):
+        headers = dict(headers or {})
+        payload = b""
+        if body is not None:
+            payload = json.dumps(body, indent=self.server.indent).encode("utf-8")
+            headers["Content-Type"] = ("application/problem+json; charset=utf-8" if "errors" in body
+                                       and isinstance(body, dict) else "application/json; charset=utf-8")
+            if self.server.etags and method == "GET" and status == 200:
+                etag = '"' + hashlib.sha1(payload).hexdigest()[:16] + '"'
+                headers["ETag"] = etag
+                if self.headers.get("If-None-Match") == etag:
+                    status, payload = 304, b""
+                    del headers["Content-Type"]
+            if self.server.gzip and payload:
+                headers["Vary"] = "Accept-Encoding"
+                if "gzip" in self.headers.get("Accept-Encoding", "").lower():
+                    payload = gzip.compress(payload, GZIP_LEVEL, mtime=0)
+                    headers["Content-Encoding"] = "gzip"
+        headers["Date"] = self.date_time_string()
+        headers["Content-Length"] = str(len(payload))
+
+        # One write per response: status line, headers and body together
+        lines = [f"HTTP/1.1 {status} {self.responses.get(status, ('',))[0]}"]
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        self.wfile.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + payload)
+        self.log_request(status, len(payload))
+        return status
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    request_queue_size = 128
+
+    def __init__(self, address, api, faults, workers=None, indent=2, etags=False, gzip=True, verbose=False):
+        super().__init__(address, StandInRequestHandler)
+        self.api = api
+        self.faults = faults
+        self.workers = threading.BoundedSemaphore(workers) if workers else _Unbounded()
+        self.indent = indent
+        self.etags = etags
+        self.gzip = gzip
+        self.verbose = verbose
+        self._stats_lock = threading.Lock()
+        self.statuses = {}
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    def record_start(self):
+        with self._stats_lock:
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def record_end(self, status):
+        with self._stats_lock:
+            self.in_flight -= 1
+            self.statuses[status] = self.statuses.get(status, 0) + 1
+
+class _Unbounded:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+class StandInServer:
+    """The stand-in API on a background thread, for use in-process.
+
+    port=0 picks a free port; `url` is the base URL to hand to the client.
+    """
+
+    def __init__(self, host=DEFAULT_HOST, port=0, latency=0.0, jitter=0.0, error_rate=0.0,
+                 commit_error_rate=0.0, throttle_rate=0.0, retry_after=1, workers=None,
+                 batch=False, pagination=False, etags=False, compact=False, gzip=True, seed=None,
+                 verbose=False):
+        self.faults = FaultInjector(latency, jitter, error_rate, commit_error_rate,
+                                    throttle_rate, retry_after, seed)
+        self.api = StandInApi(batch=batch, pagination=pagination)
+        self.httpd = _HTTPServer((host, port), self.api, self.faults, workers,
+                                 indent=None if compact else 2, etags=etags, gzip=gzip, verbose=verbose)
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/api"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="stand-in-api", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        self.httpd.serve_forever()
+
+    def stop(self):
+        if self._thread is not None:
+            self.httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self.httpd.server_close()
+
+    def stats(self):
+        with self.httpd._stats_lock:
+            return {
+                "requests": sum(self.httpd.statuses.values()),
+                "statuses": dict(sorted(self.httpd.statuses.items())),
+                "peak_in_flight": self.httpd.peak_in_flight,
+                "records": {table: len(rows) for table, rows in self.api.store.tables.items()},
+            }
+
+    def print_stats(self):
+        stats = self.stats()
+        statuses = ", ".join(f"{status}: {count}" for status, count in stats["statuses"].items())
+        print(f"Stand-in API: {stats['requests']} requests ({statuses or 'none'}), "
+              f"peak {stats['peak_in_flight']} in flight")
+
+# ---------------------------------------------------------------------------
+# Options
+# ---------------------------------------------------------------------------
+
+OPTION_TYPES = {
+    "latency": float, "jitter": float, "error_rate": float, "commit_error_rate": float,
+    "throttle_rate": float, "retry_after": int, "workers": int, "seed": int,
+    "batch": bool, "pagination": bool, "etags": bool, "compact": bool, "gzip": bool, "verbose": bool,
+}
+
+def parse_options(spec):
+    """Parse "latency=0.01,throttle_rate=0.05,batch=1" into StandInServer keyword arguments"""
+    options = {}
+    for part in filter(None, (spec or "").split(",")):
+        name, _, value = part.partition("=")
+        name = name.strip().replace("-", "_")
+        if name not in OPTION_TYPES:
+            raise ValueError(f"Unknown stand-in option {name!r} (expected one of: {', '.join(OPTION_TYPES)})")
+        kind = OPTION_TYPES[name]
+        if kind is bool:
+            options[name] = value.strip().lower() in ("", "1", "true", "yes", "on")
+        else:
+            options[name] = kind(value)
+    return options
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="In-memory stand-in for the Character Sheet Manager API")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    faults = parser.add_argument_group("fault injection")
+    faults.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    faults.add_argument("--jitter", type=float, default=0.0, help="extra random latency, up to this many seconds")
+    faults.add_argument("--error-rate", type=float, default=0.0,
+                        help="fraction of requests answered 500 without being handled")
+    faults.add_argument("--commit-error-rate", type=float, default=0.0,
+                        help="fraction of writes answered 500 after being applied")
+    faults.add_argument("--throttle-rate", type=float, default=0.0,
+                        help="fraction of requests answered 429 Too Many Requests")
+    faults.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds on 429 responses")
+    faults.add_argument("--workers", type=int, help="requests handled at once; the rest queue (default: unbounded)")
+    faults.add_argument("--seed", type=int, help="random seed for latency and fault draws")
+    extensions = parser.add_argument_group("extensions the real API does not have")
+    extensions.add_argument("--batch", action="store_true", help="accept POST <endpoint>/batch with a list")
+    extensions.add_argument("--pagination", action="store_true",
+                            help="honour ?page&pageSize and ?afterId&limit on collection reads")
+    extensions.add_argument("--etags", action="store_true", help="send ETags and answer If-None-Match with 304")
+    extensions.add_argument("--compact", action="store_true", help="unindented JSON (the API writes indented JSON)")
+    parser.add_argument("--no-gzip", dest="gzip", action="store_false",
+                        help="never gzip responses (the API does when the client accepts it)")
+    parser.add_argument("--verbose", action="store_true", help="log every request")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    options = {name: value for name, value in vars(args).items() if name not in ("host", "port")}
+    server = StandInServer(args.host, args.port, **options)
+    print(f"Stand-in API listening on {server.url}  (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        server.print_stats()
+
+if __name__ == "__main__":
+    main()